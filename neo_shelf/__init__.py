@@ -47,3 +47,9 @@ def set_active_shelf(name):
 def refresh():
     """Refresh all open shelf panels."""
     widgets.refresh_all_panels()
+
+
+def refresh_icon_paths():
+    """Rescan XBMLANGPATH icon folders next time the icon chooser opens."""
+    from . import icon_chooser
+    icon_chooser.refresh_icon_paths()
@@ -1,5 +1,14 @@
+import atexit
+import contextlib
+import hashlib
 import json
 import os
+
+try:
+    from PySide6.QtCore import QCoreApplication, QTimer
+except ImportError:
+    from PySide2.QtCore import QCoreApplication, QTimer
+
 import maya.cmds as cmds
 
 CONFIG_FILENAME = "neo_shelf_config.json"
@@ -26,17 +35,52 @@ DEFAULT_SHELF = {
     "buttons": [],
 }
 
+_BUTTON_TEMPLATE = {
+    "name": "",
+    "icon": "commandButton.png",
+    "label": "",
+    "bg_color": None,
+    "icon_tint": None,
+    "label_bg_color": None,
+    "label_text_color": None,
+    "command": "",
+    "command_type": "python",
+    "shift_command": "",
+    "shift_command_type": "python",
+    "submenu": None,
+    "annotation": "",
+}
+
+SAVE_DELAY_MS = 50
+
+_config_path = None
 _config_cache = None
 _active_shelf = None
+_dirty = False
+_flush_scheduled = False
+_batch_depth = 0
+_last_written_hash = None
+# Transient reverse index of config["panels"]: shelf name -> set of workspace names
+_panels_by_shelf = None
+# Transient reverse index of the trigger settings: trigger -> action
+_trigger_actions = None
 
 
 def get_config_path():
-    scripts_dir = cmds.internalVar(userScriptDir=True)
-    return os.path.join(scripts_dir, CONFIG_FILENAME)
+    global _config_path
+    if _config_path is None:
+        scripts_dir = cmds.internalVar(userScriptDir=True)
+        _config_path = os.path.join(scripts_dir, CONFIG_FILENAME)
+    return _config_path
+
 
+def load_config(force=False):
+    global _config_cache, _panels_by_shelf, _trigger_actions
+    if _config_cache is not None and not force:
+        return _config_cache
 
-def load_config():
-    global _config_cache
+    _panels_by_shelf = None
+    _trigger_actions = None
     path = get_config_path()
     if os.path.exists(path):
         try:
@@ -57,21 +101,88 @@ def load_config():
     return _config_cache
 
 
+def invalidate_config():
+    """Drop the cached config so the next load re-reads it from disk."""
+    global _config_cache, _panels_by_shelf, _trigger_actions
+    _config_cache = None
+    _panels_by_shelf = None
+    _trigger_actions = None
+
+
 def save_config(config=None):
-    global _config_cache
-    if config is not None:
+    """Mark the config dirty and schedule a deferred write to disk."""
+    global _config_cache, _dirty, _panels_by_shelf, _trigger_actions
+    if config is not None and config is not _config_cache:
         _config_cache = config
+        _panels_by_shelf = None
+        _trigger_actions = None
     if _config_cache is None:
         return
 
+    _dirty = True
+    if _batch_depth == 0:
+        _schedule_flush()
+
+
+def _schedule_flush():
+    global _flush_scheduled
+    if _flush_scheduled:
+        return
+    # Without a running Qt app (mayapy/batch) nothing would fire the timer
+    if QCoreApplication.instance() is None:
+        flush_config()
+        return
+    _flush_scheduled = True
+    QTimer.singleShot(SAVE_DELAY_MS, _on_flush_timeout)
+
+
+def _on_flush_timeout():
+    global _flush_scheduled
+    _flush_scheduled = False
+    flush_config()
+
+
+def flush_config():
+    """Write pending config changes to disk immediately."""
+    global _dirty, _last_written_hash
+    if not _dirty or _config_cache is None:
+        return
+
     path = get_config_path()
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(_config_cache, f, indent=2)
+        if os.environ.get("NEO_SHELF_PRETTY") == "1":
+            payload = json.dumps(_config_cache, indent=2, ensure_ascii=False)
+        else:
+            payload = json.dumps(_config_cache, separators=(",", ":"), ensure_ascii=False)
+        data = payload.encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if digest != _last_written_hash:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            _last_written_hash = digest
+        _dirty = False
     except Exception as e:
         cmds.warning("Failed to save neo_shelf config: {}".format(e))
 
 
+@contextlib.contextmanager
+def batch_edits():
+    """Group several mutations so they produce a single config write."""
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0 and _dirty:
+            _schedule_flush()
+
+
+atexit.register(flush_config)
+
+
 def get_active_shelf():
     global _active_shelf
     if _active_shelf:
@@ -82,17 +193,33 @@ def get_active_shelf():
 
 def set_active_shelf(name):
     global _active_shelf
-    _active_shelf = name
     config = load_config()
+    if _active_shelf == name and config.get("active_shelf") == name:
+        return
+    _active_shelf = name
     config["active_shelf"] = name
     save_config()
 
 
+def _get_panel_index():
+    global _panels_by_shelf
+    if _panels_by_shelf is None:
+        _panels_by_shelf = {}
+        for workspace_name, shelf_name in load_config().get("panels", {}).items():
+            _panels_by_shelf.setdefault(shelf_name, set()).add(workspace_name)
+    return _panels_by_shelf
+
+
+def _new_shelf():
+    # Fresh color lists and buttons list so nothing is shared between shelves;
+    # the defaults are one level deep, so this is all deepcopy would do
+    return {k: list(v) if isinstance(v, list) else v for k, v in DEFAULT_SHELF.items()}
+
+
 def create_shelf(name):
     config = load_config()
     if name not in config["shelves"]:
-        config["shelves"][name] = dict(DEFAULT_SHELF)
-        config["shelves"][name]["buttons"] = []
+        config["shelves"][name] = _new_shelf()
         save_config()
         return True
     return False
@@ -102,9 +229,9 @@ def delete_shelf(name):
     config = load_config()
     if name in config["shelves"]:
         del config["shelves"][name]
-        panels_to_remove = [p for p, s in config.get("panels", {}).items() if s == name]
-        for p in panels_to_remove:
-            del config["panels"][p]
+        panels = config.get("panels", {})
+        for p in _get_panel_index().pop(name, ()):
+            panels.pop(p, None)
         if config.get("active_shelf") == name:
             config["active_shelf"] = ""
         save_config()
@@ -116,9 +243,13 @@ def rename_shelf(old_name, new_name):
     config = load_config()
     if old_name in config["shelves"] and new_name not in config["shelves"]:
         config["shelves"][new_name] = config["shelves"].pop(old_name)
-        for p, s in list(config.get("panels", {}).items()):
-            if s == old_name:
-                config["panels"][p] = new_name
+        panel_index = _get_panel_index()
+        moved = panel_index.pop(old_name, None)
+        if moved:
+            panels = config["panels"]
+            for p in moved:
+                panels[p] = new_name
+            panel_index.setdefault(new_name, set()).update(moved)
         if config.get("active_shelf") == old_name:
             config["active_shelf"] = new_name
         save_config()
@@ -134,10 +265,14 @@ def get_shelf_data(name):
 def update_shelf_settings(name, **kwargs):
     config = load_config()
     if name in config["shelves"]:
+        shelf = config["shelves"][name]
+        changed = False
         for key, val in kwargs.items():
-            if val is not None:
-                config["shelves"][name][key] = val
-        save_config()
+            if val is not None and shelf.get(key) != val:
+                shelf[key] = val
+                changed = True
+        if changed:
+            save_config()
         return True
     return False
 
@@ -157,14 +292,26 @@ def add_button_to_shelf(shelf_name, button_data, index=None):
     return True
 
 
-def update_button(shelf_name, button_index, updates):
+def add_buttons_to_shelf(shelf_name, buttons_data):
     config = load_config()
-    shelf = config.get("shelves", {}).get(shelf_name)
+    if shelf_name not in config["shelves"]:
+        create_shelf(shelf_name)
+
+    config["shelves"][shelf_name].setdefault("buttons", []).extend(buttons_data)
+    save_config()
+    return True
+
+
+def _get_buttons(shelf_name):
+    shelf = load_config().get("shelves", {}).get(shelf_name)
     if not shelf:
-        return False
+        return None
+    return shelf.get("buttons", [])
 
-    buttons = shelf.get("buttons", [])
-    if button_index < 0 or button_index >= len(buttons):
+
+def update_button(shelf_name, button_index, updates):
+    buttons = _get_buttons(shelf_name)
+    if buttons is None or not 0 <= button_index < len(buttons):
         return False
 
     buttons[button_index].update(updates)
@@ -172,14 +319,26 @@ def update_button(shelf_name, button_index, updates):
     return True
 
 
-def remove_button(shelf_name, button_index):
-    config = load_config()
-    shelf = config.get("shelves", {}).get(shelf_name)
-    if not shelf:
+def update_buttons(shelf_name, button_indices, updates):
+    """Apply the same updates to several buttons with a single save."""
+    buttons = _get_buttons(shelf_name)
+    if buttons is None:
         return False
 
-    buttons = shelf.get("buttons", [])
-    if button_index < 0 or button_index >= len(buttons):
+    count = len(buttons)
+    changed = False
+    for button_index in button_indices:
+        if 0 <= button_index < count:
+            buttons[button_index].update(updates)
+            changed = True
+    if changed:
+        save_config()
+    return changed
+
+
+def remove_button(shelf_name, button_index):
+    buttons = _get_buttons(shelf_name)
+    if buttons is None or not 0 <= button_index < len(buttons):
         return False
 
     buttons.pop(button_index)
@@ -188,15 +347,12 @@ def remove_button(shelf_name, button_index):
 
 
 def move_button(shelf_name, from_index, to_index):
-    config = load_config()
-    shelf = config.get("shelves", {}).get(shelf_name)
-    if not shelf:
+    buttons = _get_buttons(shelf_name)
+    if buttons is None:
         return False
 
-    buttons = shelf.get("buttons", [])
-    if from_index < 0 or from_index >= len(buttons):
-        return False
-    if to_index < 0 or to_index > len(buttons):
+    count = len(buttons)
+    if not 0 <= from_index < count or not 0 <= to_index <= count:
         return False
 
     btn = buttons.pop(from_index)
@@ -208,8 +364,7 @@ def move_button(shelf_name, from_index, to_index):
 
 
 def update_shelf_buttons(shelf_name, buttons):
-    config = load_config()
-    shelf = config.get("shelves", {}).get(shelf_name)
+    shelf = load_config().get("shelves", {}).get(shelf_name)
     if not shelf:
         return False
     shelf["buttons"] = buttons
@@ -222,35 +377,42 @@ def get_all_shelf_names():
     return list(config.get("shelves", {}).keys())
 
 
+def shelf_exists(name):
+    return name in load_config().get("shelves", {})
+
+
 def register_panel(workspace_name, shelf_name):
     config = load_config()
-    config.setdefault("panels", {})[workspace_name] = shelf_name
+    panel_index = _get_panel_index()
+    panels = config.setdefault("panels", {})
+    previous = panels.get(workspace_name)
+    if previous == shelf_name:
+        return
+    if previous is not None:
+        panel_index.get(previous, set()).discard(workspace_name)
+    panels[workspace_name] = shelf_name
+    panel_index.setdefault(shelf_name, set()).add(workspace_name)
     save_config()
 
 
 def unregister_panel(workspace_name):
     config = load_config()
     if workspace_name in config.get("panels", {}):
-        del config["panels"][workspace_name]
+        shelf_name = config["panels"].pop(workspace_name)
+        _get_panel_index().get(shelf_name, set()).discard(workspace_name)
         save_config()
 
 
 def make_default_button(name="", label="", command="", command_type="python", icon="commandButton.png"):
-    return {
-        "name": name,
-        "icon": icon,
-        "label": label,
-        "bg_color": None,
-        "icon_tint": None,
-        "label_bg_color": None,
-        "label_text_color": None,
-        "command": command,
-        "command_type": command_type,
-        "shift_command": "",
-        "shift_command_type": "python",
-        "submenu": [],
-        "annotation": "",
-    }
+    return dict(
+        _BUTTON_TEMPLATE,
+        name=name,
+        icon=icon,
+        label=label,
+        command=command,
+        command_type=command_type,
+        submenu=[],
+    )
 
 
 def make_separator():
@@ -262,7 +424,21 @@ def get_trigger_settings():
     return config.get("settings", {}).get("triggers", DEFAULT_SETTINGS["triggers"])
 
 
+def get_trigger_actions():
+    """Return a trigger -> action mapping of the trigger settings."""
+    global _trigger_actions
+    if _trigger_actions is None:
+        actions = {}
+        for action, trigger in get_trigger_settings().items():
+            # First action wins if two share a trigger, as a linear scan would
+            actions.setdefault(trigger, action)
+        _trigger_actions = actions
+    return _trigger_actions
+
+
 def set_trigger_settings(triggers):
+    global _trigger_actions
     config = load_config()
     config.setdefault("settings", {})["triggers"] = triggers
+    _trigger_actions = None
     save_config()
@@ -31,31 +31,21 @@ def extract_menu_item_data(menu_item):
         cmds.warning("[neo_shelf] Menu item not found: {}".format(menu_item))
         return None
 
+    # menuItem only answers one query flag per call, so these stay separate
     label = cmds.menuItem(menu_item, query=True, label=True) or "Unknown"
     annotation = cmds.menuItem(menu_item, query=True, annotation=True) or ""
     command = cmds.menuItem(menu_item, query=True, command=True) or ""
     source_type = cmds.menuItem(menu_item, query=True, sourceType=True) or "mel"
-    image = cmds.menuItem(menu_item, query=True, image=True) or ""
-
-    if not image:
-        image = "commandButton.png"
-
-    command_type = "mel" if source_type == "mel" else "python"
-
-    return {
-        "icon": image,
-        "label": label[:12] if len(label) > 12 else label,
-        "width": None,
-        "bg_color": None,
-        "label_bg_color": None,
-        "label_text_color": None,
-        "command": command,
-        "command_type": command_type,
-        "shift_command": "",
-        "shift_command_type": "python",
-        "submenu": [],
-        "annotation": annotation or label,
-    }
+    image = cmds.menuItem(menu_item, query=True, image=True) or "commandButton.png"
+
+    button_data = core.make_default_button(
+        label=label[:12],
+        command=command,
+        command_type="mel" if source_type == "mel" else "python",
+        icon=image,
+    )
+    button_data["annotation"] = annotation or label
+    return button_data
 
 
 def refresh_active_panel():
@@ -3,9 +3,66 @@ import maya.cmds as cmds
 import os
 import platform
 import re
+from functools import lru_cache
 
 __version__ = "1.4.0"
 
+EXCLUDE_EXTS = frozenset(("tdi", "iff"))
+REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _keep_icon(name):
+    if name.startswith(".") or "." not in name:
+        return False
+    return name.rsplit(".", 1)[-1].lower() not in EXCLUDE_EXTS
+
+
+def _list_icons(path):
+    """Return icon file names in path using a single directory scan."""
+    with os.scandir(path) as it:
+        return [e.name for e in it if e.is_file() and _keep_icon(e.name)]
+
+
+@lru_cache(maxsize=1)
+def _discover_icon_paths():
+    """Return ((path, icon_names), ...) for each usable XBMLANGPATH directory.
+
+    Computed once per session; call refresh_icon_paths() to rescan.
+    """
+    delimiter = ';' if platform.system() == 'Windows' else ':'
+    icon_paths = os.environ.get('XBMLANGPATH', '').split(delimiter)
+    
+    if platform.system() == 'Linux':
+        icon_paths = [os.path.dirname(p) for p in icon_paths if p.endswith('%B')]
+    
+    found = []
+    seen = set()
+    for p in icon_paths:
+        if not p or p in seen:
+            continue
+        seen.add(p)
+        if not os.path.isdir(p):
+            continue
+        try:
+            files = _list_icons(p)
+        except OSError:
+            continue
+        if files:
+            found.append((p, tuple(files)))
+    return tuple(found)
+
+
+@lru_cache(maxsize=1)
+def _internal_icons():
+    """Return Maya's built-in PNG resource names, queried once per session."""
+    return tuple(cmds.resourceManager(nameFilter="*.png") or ())
+
+
+def refresh_icon_paths():
+    """Forget the discovered icon paths so the next chooser rescans them."""
+    _discover_icon_paths.cache_clear()
+
+
 class IconChooser:
     WINDOW_NAME = "iconChooserWindow"
     
@@ -16,20 +73,13 @@ class IconChooser:
         self.cur_icon_path = ""
         self.icon_buttons = []
         
-        delimiter = ';' if platform.system() == 'Windows' else ':'
-        icon_paths = os.environ.get('XBMLANGPATH', '').split(delimiter)
-        
-        if platform.system() == 'Linux':
-            icon_paths = [os.path.dirname(p) for p in icon_paths if p.endswith('%B')]
-        
         self.path_with_icons = []
-        for p in icon_paths:
-            if os.path.isdir(p):
-                files = os.listdir(p)
-                if files:
-                    self.path_with_icons.append(p)
+        self._path_icons = {}
+        for p, files in _discover_icon_paths():
+            self.path_with_icons.append(p)
+            self._path_icons[p] = files
         
-        self.all_internal_icons = cmds.resourceManager(nameFilter="*.png") or []
+        self.all_internal_icons = _internal_icons()
         self.path_with_icons.insert(0, 'Internal Icons')
         self.path_with_icons.insert(0, 'All Paths')
         
@@ -43,14 +93,11 @@ class IconChooser:
                 self.icon_path_map[icon_name] = 'Internal Icons'
         
         for path in self.path_with_icons[2:]:
-            try:
-                files = os.listdir(path)
-                files = self._exclude_icons(files)
-                for icon_name in files:
-                    if icon_name not in self.icon_path_map:
-                        self.icon_path_map[icon_name] = path
-            except OSError:
-                pass
+            for icon_name in self._path_icons.get(path, ()):
+                if icon_name not in self.icon_path_map:
+                    self.icon_path_map[icon_name] = path
+        
+        self._all_paths_sorted = sorted(self.icon_path_map)
     
     def _build_ui(self):
         if cmds.window(self.WINDOW_NAME, exists=True):
@@ -88,11 +135,7 @@ class IconChooser:
             childResizable=True,
             height=350
         )
-        self.icon_grid = cmds.gridLayout(
-            numberOfColumns=12,
-            cellWidthHeight=(46, 46),
-            allowEmptyCells=True
-        )
+        self.icon_grid = self._create_grid()
         cmds.setParent('..')
         cmds.setParent('..')
         
@@ -106,17 +149,6 @@ class IconChooser:
         self._update_icon_list()
         cmds.showWindow(self.window)
     
-    def _exclude_icons(self, icons):
-        exclude_ext = ('tdi', 'iff')
-        result = []
-        for i in icons:
-            if '.' not in i:
-                continue
-            ext = i.rsplit('.', 1)[-1].lower()
-            if ext not in exclude_ext:
-                result.append(i)
-        return result
-    
     def _get_icon_path(self, icon_name):
         if self.cur_icon_path == 'All Paths':
             source_path = self.icon_path_map.get(icon_name, 'Internal Icons')
@@ -143,28 +175,39 @@ class IconChooser:
             display = f"{icon_name} | {full_path}"
         cmds.textField(self.selected_field, edit=True, text=display)
     
+    def _create_grid(self):
+        return cmds.gridLayout(
+            parent=self.scroll_layout,
+            numberOfColumns=12,
+            cellWidthHeight=(46, 46),
+            allowEmptyCells=True
+        )
+    
     def _clear_grid(self):
+        # Deleting the layout takes its children with it in one command
         if cmds.gridLayout(self.icon_grid, exists=True):
-            children = cmds.gridLayout(self.icon_grid, query=True, childArray=True) or []
-            for child in children:
-                cmds.deleteUI(child)
+            cmds.deleteUI(self.icon_grid)
+        self.icon_grid = self._create_grid()
         self.icon_buttons = []
     
     def _populate_icons(self, filter_text=""):
         self._clear_grid()
         
-        pattern = None
+        icons = self.cur_all_icons
         if filter_text:
-            try:
-                pattern = re.compile(filter_text, re.IGNORECASE)
-            except re.error:
-                pattern = re.compile(re.escape(filter_text), re.IGNORECASE)
+            if any(c in REGEX_CHARS for c in filter_text):
+                try:
+                    pattern = re.compile(filter_text, re.IGNORECASE)
+                except re.error:
+                    pattern = re.compile(re.escape(filter_text), re.IGNORECASE)
+                search = pattern.search
+                icons = [n for n in icons if search(n)]
+            else:
+                # Plain text: a lowercase substring test is much cheaper than re
+                needle = filter_text.lower()
+                icons = [n for n in icons if needle in n.lower()]
         
-        count = 0
-        for icon_name in self.cur_all_icons:
-            if pattern and not pattern.search(icon_name):
-                continue
-            
+        for icon_name in icons:
             icon_path = self._get_icon_path(icon_name)
             
             btn = cmds.iconTextButton(
@@ -177,24 +220,22 @@ class IconChooser:
                 command=lambda n=icon_name: self._on_icon_clicked(n)
             )
             self.icon_buttons.append(btn)
-            count += 1
         
-        cmds.text(self.count_label, edit=True, label=f"Icons: {count}")
+        cmds.text(self.count_label, edit=True, label=f"Icons: {len(icons)}")
     
     def _update_icon_list(self):
         selected_idx = cmds.optionMenu(self.path_menu, query=True, select=True) - 1
         self.cur_icon_path = self.path_with_icons[selected_idx]
         
         if selected_idx == 0:
-            self.cur_all_icons = sorted(self.icon_path_map.keys())
+            self.cur_all_icons = self._all_paths_sorted
         elif selected_idx == 1:
-            self.cur_all_icons = self.all_internal_icons[:]
+            self.cur_all_icons = self.all_internal_icons
         else:
             try:
-                self.cur_all_icons = os.listdir(self.cur_icon_path)
+                self.cur_all_icons = _list_icons(self.cur_icon_path)
             except OSError:
                 self.cur_all_icons = []
-            self.cur_all_icons = self._exclude_icons(self.cur_all_icons)
     
     def _on_path_changed(self, *args):
         self._update_icon_list()
@@ -211,28 +252,85 @@ def main():
 
 
 # PySide dialog version for integration with button_editor
-from functools import partial
+from collections import OrderedDict
 
 try:
-    from PySide6.QtCore import Qt, QSize
+    from PySide6.QtCore import Qt, QSize, QAbstractListModel, QModelIndex
     from PySide6.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-        QComboBox, QLabel, QScrollArea, QWidget, QGridLayout,
-        QToolButton, QDialogButtonBox, QFileDialog
+        QComboBox, QLabel, QListView, QDialogButtonBox, QFileDialog
     )
     from PySide6.QtGui import QIcon
 except ImportError:
-    from PySide2.QtCore import Qt, QSize
+    from PySide2.QtCore import Qt, QSize, QAbstractListModel, QModelIndex
     from PySide2.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-        QComboBox, QLabel, QScrollArea, QWidget, QGridLayout,
-        QToolButton, QDialogButtonBox, QFileDialog
+        QComboBox, QLabel, QListView, QDialogButtonBox, QFileDialog
     )
     from PySide2.QtGui import QIcon
 
 from . import core
 
 ADD_FOLDER_ITEM = "Add Icon Folder..."
+ICON_CACHE_SIZE = 4096
+
+ICON_NAME_ROLE = Qt.UserRole
+ICON_PATH_ROLE = Qt.UserRole + 1
+ICON_SOURCE_ROLE = Qt.UserRole + 2
+
+# Lives at module scope so icons survive across dialog opens
+_icon_cache = OrderedDict()
+
+
+def _qicon(path):
+    """Return a cached QIcon for path, evicting the least recently used."""
+    icon = _icon_cache.get(path)
+    if icon is not None:
+        _icon_cache.move_to_end(path)
+        return icon
+    icon = QIcon(path)
+    _icon_cache[path] = icon
+    if len(_icon_cache) > ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return icon
+
+
+class IconListModel(QAbstractListModel):
+    """List model that only loads icons for the rows the view asks for."""
+
+    def __init__(self, parent=None):
+        super(IconListModel, self).__init__(parent)
+        self._names = []
+        self._resolver = None
+
+    def set_icons(self, names, resolver):
+        """Replace the icon names. resolver(name) returns (icon_path, source)."""
+        self.beginResetModel()
+        self._names = names
+        self._resolver = resolver
+        self.endResetModel()
+
+    def clear(self):
+        self.set_icons([], None)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self._names[index.row()]
+        if role == Qt.DecorationRole:
+            return _qicon(self._resolver(name)[0])
+        if role == Qt.ToolTipRole or role == ICON_NAME_ROLE:
+            return name
+        if role == ICON_PATH_ROLE:
+            return self._resolver(name)[0]
+        if role == ICON_SOURCE_ROLE:
+            return self._resolver(name)[1]
+        return None
 
 
 class IconChooserDialog(QDialog):
@@ -242,37 +340,25 @@ class IconChooserDialog(QDialog):
         super(IconChooserDialog, self).__init__(parent)
         self._callback = callback
         self._selected_icon = ""
-        self._icon_buttons = []
+        self._shown_path = ""
 
         self._setup_icon_data()
         self._build_ui()
 
     def _setup_icon_data(self):
-        self.all_internal_icons = cmds.resourceManager(nameFilter="*.png") or []
+        self.all_internal_icons = _internal_icons()
         self.icon_path_map = {}
+        self._all_entries = None
 
         for icon_name in self.all_internal_icons:
             self.icon_path_map[icon_name] = "Internal Icons"
 
-        delimiter = ";" if platform.system() == "Windows" else ":"
-        icon_paths = os.environ.get("XBMLANGPATH", "").split(delimiter)
-
-        if platform.system() == "Linux":
-            icon_paths = [os.path.dirname(p) for p in icon_paths if p.endswith("%B")]
-
         self.path_with_icons = ["Internal Icons", "All Paths"]
-        for p in icon_paths:
-            if os.path.isdir(p):
-                try:
-                    files = os.listdir(p)
-                    if files:
-                        self.path_with_icons.append(p)
-                        for f in files:
-                            if "." in f and f.rsplit(".", 1)[-1].lower() not in ("tdi", "iff"):
-                                if f not in self.icon_path_map:
-                                    self.icon_path_map[f] = p
-                except OSError:
-                    pass
+        for p, files in _discover_icon_paths():
+            self.path_with_icons.append(p)
+            for f in files:
+                if f not in self.icon_path_map:
+                    self.icon_path_map[f] = p
 
         # Load custom icon folders from config
         self.custom_folders = self._load_custom_folders()
@@ -297,13 +383,13 @@ class IconChooserDialog(QDialog):
 
     def _add_folder_to_map(self, folder):
         try:
-            files = os.listdir(folder)
-            for f in files:
-                if "." in f and f.rsplit(".", 1)[-1].lower() not in ("tdi", "iff"):
-                    if f not in self.icon_path_map:
-                        self.icon_path_map[f] = folder
+            files = _list_icons(folder)
         except OSError:
-            pass
+            return
+        for f in files:
+            if f not in self.icon_path_map:
+                self.icon_path_map[f] = folder
+        self._all_entries = None
 
     def _build_ui(self):
         self.setWindowTitle("Icon Chooser")
@@ -338,17 +424,22 @@ class IconChooserDialog(QDialog):
         self._count_label = QLabel("Icons: 0")
         layout.addWidget(self._count_label)
 
-        # Scroll area with grid
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        self._grid_widget = QWidget()
-        self._grid_layout = QGridLayout(self._grid_widget)
-        self._grid_layout.setSpacing(2)
-        self._scroll.setWidget(self._grid_widget)
-
-        layout.addWidget(self._scroll, 1)
+        # Icon view - only visible cells are realized
+        self._model = IconListModel(self)
+        self._view = QListView()
+        self._view.setViewMode(QListView.IconMode)
+        self._view.setResizeMode(QListView.Adjust)
+        self._view.setMovement(QListView.Static)
+        self._view.setUniformItemSizes(True)
+        self._view.setLayoutMode(QListView.Batched)
+        self._view.setBatchSize(200)
+        self._view.setIconSize(QSize(40, 40))
+        self._view.setGridSize(QSize(46, 46))
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setModel(self._model)
+        self._view.clicked.connect(self._on_any_icon_clicked)
+
+        layout.addWidget(self._view, 1)
 
         # Selected display
         selected_row = QHBoxLayout()
@@ -388,25 +479,25 @@ class IconChooserDialog(QDialog):
                 self._path_combo.setCurrentIndex(0)
                 return
 
-        self._clear_grid()
+        self._model.clear()
         self._count_label.setText("Icons: 0")
 
-    def _clear_grid(self):
-        while self._grid_layout.count():
-            item = self._grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self._icon_buttons.clear()
+    def _get_all_entries(self):
+        """Sorted (name, lowercase name, source) tuples for the All Paths view."""
+        if self._all_entries is None:
+            self._all_entries = sorted(
+                (name, name.lower(), source) for name, source in self.icon_path_map.items()
+            )
+        return self._all_entries
 
     def _get_icons_for_path(self, path_name):
         if path_name == "All Paths":
-            return sorted(self.icon_path_map.keys())
+            return [name for name, _, _ in self._get_all_entries()]
         elif path_name == "Internal Icons":
-            return self.all_internal_icons[:]
+            return self.all_internal_icons
         else:
             try:
-                files = os.listdir(path_name)
-                return [f for f in files if "." in f and f.rsplit(".", 1)[-1].lower() not in ("tdi", "iff")]
+                return _list_icons(path_name)
             except OSError:
                 return []
 
@@ -415,52 +506,40 @@ class IconChooserDialog(QDialog):
             return ":{}".format(icon_name)
         return os.path.join(source_path, icon_name).replace("\\", "/")
 
-    def _populate_icons(self):
-        self._clear_grid()
+    def _resolve_icon(self, icon_name):
+        path_name = self._shown_path
+        if path_name == "All Paths":
+            source = self.icon_path_map.get(icon_name, "Internal Icons")
+        elif path_name == "Internal Icons":
+            source = "Internal Icons"
+        else:
+            source = path_name
+        return self._get_icon_display_path(icon_name, source), source
 
+    def _populate_icons(self):
         path_name = self._path_combo.currentText()
         if path_name == ADD_FOLDER_ITEM:
+            self._model.clear()
             return
 
-        icons = self._get_icons_for_path(path_name)
-
         filter_text = self._filter_edit.text().strip().lower()
-        if filter_text:
-            icons = [i for i in icons if filter_text in i.lower()]
-
-        cols = 12
-        count = 0
-
-        for i, icon_name in enumerate(icons):
-            if path_name == "All Paths":
-                source = self.icon_path_map.get(icon_name, "Internal Icons")
-            elif path_name == "Internal Icons":
-                source = "Internal Icons"
-            else:
-                source = path_name
-
-            icon_path = self._get_icon_display_path(icon_name, source)
-
-            btn = QToolButton()
-            btn.setAutoRaise(True)
-            btn.setToolTip(icon_name)
-            btn.setFixedSize(QSize(44, 44))
-            btn.setIconSize(QSize(40, 40))
-
-            if source == "Internal Icons":
-                btn.setIcon(QIcon(":{}".format(icon_name)))
-            else:
-                btn.setIcon(QIcon(icon_path))
-
-            btn.clicked.connect(partial(self._on_icon_clicked, icon_name, icon_path, source))
-
-            row = i // cols
-            col = i % cols
-            self._grid_layout.addWidget(btn, row, col)
-            self._icon_buttons.append(btn)
-            count += 1
-
-        self._count_label.setText("Icons: {}".format(count))
+        if path_name == "All Paths" and filter_text:
+            icons = [name for name, lower, _ in self._get_all_entries() if filter_text in lower]
+        else:
+            icons = self._get_icons_for_path(path_name)
+            if filter_text:
+                icons = [i for i in icons if filter_text in i.lower()]
+
+        self._shown_path = path_name
+        self._model.set_icons(icons, self._resolve_icon)
+        self._count_label.setText("Icons: {}".format(len(icons)))
+
+    def _on_any_icon_clicked(self, index):
+        self._on_icon_clicked(
+            index.data(ICON_NAME_ROLE),
+            index.data(ICON_PATH_ROLE),
+            index.data(ICON_SOURCE_ROLE)
+        )
 
     def _on_icon_clicked(self, icon_name, icon_path, source):
         # For internal icons, store just the name. For external, store full path.
@@ -474,4 +553,4 @@ class IconChooserDialog(QDialog):
     def _accept_selection(self):
         if self._callback and self._selected_icon:
             self._callback(self._selected_icon)
-        self.accept()
\ No newline at end of file
+        self.accept()
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import os
 import re
+import sys
 
 try:
     from PySide6.QtWidgets import QFileDialog, QMessageBox
@@ -10,6 +14,56 @@ import maya.cmds as cmds
 
 from . import core
 
+READ_SIZE = 65536
+MAX_PARSE_WORKERS = 8
+
+CACHE_DIRNAME = "neo_shelf_cache"
+# Bump when the parser output changes so stale cache entries are ignored
+_CACHE_VERSION = 2
+
+# Maya names shelf procs shelf_<name>; the prefix is stripped by the match itself
+_HEADER_RE = re.compile(r'\s*global\s+proc\s+(?:shelf_(?=\w))?(\w+)\s*\(\s*\)')
+
+# shelfButton / separator blocks; the ; that ends a block is on its own line
+_BLOCK_RE = re.compile(
+    r'(?P<kind>shelfButton|separator)\s+(.*?)\n[ \t]*;',
+    re.DOTALL
+)
+
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?!\S)'
+
+# One left-to-right pass over a shelfButton block. Each match is one of:
+#   -mi "Label" ( "command" )      submenu item
+#   -flag "value" / -flag 1 2 3    flag with a string or numeric value
+#   "..."                          any other string, consumed so a "-flag"
+#                                  inside it is never mistaken for a real one
+_FLAG_LEXER = re.compile(
+    r'-mi\s+"([^"]+)"\s*\(\s*' + _STRING + r'\s*\)'
+    r'|-(\w+)\s+(?:' + _STRING + r'|(' + _NUMBER + r'(?:\s+' + _NUMBER + r')*))'
+    r'|"(?:[^"\\]|\\.)*"'
+)
+
+# (flag, button key) for string flags copied straight onto the button
+_STRING_FIELDS = (
+    ("annotation", "annotation"),
+    ("label", "name"),
+    ("imageOverlayLabel", "label"),
+    ("command", "command"),
+)
+
+# (flag, button key, number of values)
+_NUMERIC_FIELDS = (
+    ("overlayLabelColor", "label_text_color", 3),
+    ("overlayLabelBackColor", "label_bg_color", 4),
+)
+
+# MEL string escape sequences; unknown escapes are left as written
+_ESC_MAP = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+_ESC_RE = re.compile(r'\\(.)')
+
+_cache_dir = None
+
 
 def get_maya_shelves_dir():
     """Get the Maya user prefs shelves directory."""
@@ -17,167 +71,183 @@ def get_maya_shelves_dir():
     return os.path.join(prefs_dir, "shelves").replace("\\", "/")
 
 
+def _iter_blocks(f, buf):
+    """Yield (kind, block) for each complete block in buf, then the rest of f."""
+    # A match found in a prefix of the file is the same match the full text
+    # would give, so consumed text can be dropped as each chunk arrives
+    while True:
+        pos = 0
+        for m in _BLOCK_RE.finditer(buf):
+            yield m.group("kind"), m.group(2)
+            pos = m.end()
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            return
+        buf = buf[pos:] + chunk
+
+
+def get_cache_dir():
+    # Resolved once on the main thread; parsing may run on worker threads
+    global _cache_dir
+    if _cache_dir is None:
+        _cache_dir = os.path.join(cmds.internalVar(userAppDir=True), CACHE_DIRNAME)
+    return _cache_dir
+
+
+def _get_cache_path(file_path):
+    key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), key + ".json")
+
+
+def _load_cached(cache_path, st):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Anything malformed is treated as a miss so the file is parsed again
+    if not isinstance(entry, dict):
+        return None
+    if (entry.get("version") != _CACHE_VERSION
+            or entry.get("mtime") != st.st_mtime_ns
+            or entry.get("size") != st.st_size):
+        return None
+    try:
+        shelf_name, buttons = entry["data"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    return shelf_name, buttons
+
+
+def _store_cached(cache_path, st, result):
+    entry = {
+        "version": _CACHE_VERSION,
+        "mtime": st.st_mtime_ns,
+        "size": st.st_size,
+        "data": list(result),
+    }
+    tmp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Best effort, and may run off the main thread where cmds is unsafe;
+        # a failed write only means the next import parses again
+        pass
+
+
 def parse_shelf_mel(file_path):
-    """Parse a Maya shelf .mel file and return shelf name and button data."""
-    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-        content = f.read()
-
-    # Check for valid shelf file structure
-    match = re.match(r'\s*global\s+proc\s+(\w+)\s*\(\s*\)', content)
-    if not match:
-        raise ValueError("Invalid shelf file: must start with 'global proc name ()'")
-
-    shelf_name = match.group(1)
-    # Remove shelf_ prefix if present
-    if shelf_name.startswith("shelf_"):
-        shelf_name = shelf_name[6:]
-
-    buttons = []
-
-    # Find all shelfButton and separator blocks
-    # The ; that ends a block is on its own line (preceded by whitespace only)
-    shelf_button_pattern = re.compile(
-        r'shelfButton\s+(.*?)\n[ \t]*;',
-        re.DOTALL
-    )
-    separator_pattern = re.compile(
-        r'separator\s+(.*?)\n[ \t]*;',
-        re.DOTALL
-    )
+    """Parse a Maya shelf .mel file and return shelf name and button data.
 
-    # Find positions of all shelfButton and separator commands
-    items = []
-    for m in shelf_button_pattern.finditer(content):
-        items.append(("button", m.start(), m.group(1)))
-    for m in separator_pattern.finditer(content):
-        items.append(("separator", m.start(), m.group(1)))
-
-    # Sort by position in file
-    items.sort(key=lambda x: x[1])
-
-    for item_type, _, block in items:
-        if item_type == "separator":
-            buttons.append(core.make_separator())
-        else:
-            btn = parse_shelf_button(block)
-            if btn:
-                buttons.append(btn)
+    Results are cached on disk keyed by the file's mtime and size, so
+    re-importing an unchanged file skips parsing.
+    """
+    st = os.stat(file_path)
+    cache_path = _get_cache_path(file_path)
+    cached = _load_cached(cache_path, st)
+    if cached is not None:
+        return cached
+
+    result = _parse_shelf_file(file_path)
+    _store_cached(cache_path, st, result)
+    return result
+
+
+def _parse_shelf_file(file_path):
+    with open(file_path, "r", encoding="utf-8", errors="replace", buffering=READ_SIZE) as f:
+        head = f.read(READ_SIZE)
+
+        # Check for valid shelf file structure
+        match = _HEADER_RE.match(head)
+        if not match:
+            raise ValueError("Invalid shelf file: must start with 'global proc name ()'")
+
+        shelf_name = match.group(1)
+
+        # Single pass over the file - matches arrive in document order
+        buttons = [
+            core.make_separator() if kind == "separator" else parse_shelf_button(block)
+            for kind, block in _iter_blocks(f, head[match.end():])
+        ]
 
     return shelf_name, buttons
 
 
+def _unescape_match(m):
+    return _ESC_MAP.get(m.group(1), m.group(0))
+
+
+def unescape_mel(s):
+    """Unescape a MEL string literal body in a single pass."""
+    if "\\" not in s:
+        return s
+    return _ESC_RE.sub(_unescape_match, s)
+
+
 def parse_shelf_button(block):
     """Parse a shelfButton block and return button data dict."""
     btn = core.make_default_button()
 
-    # Extract simple string flags
-    def get_string_flag(flag_name):
-        # Match -flag "value" or -flag "value with spaces"
-        # Handle escaped quotes inside the string
-        pattern = r'-{}\s+"((?:[^"\\]|\\.)*)"\s*'.format(flag_name)
-        m = re.search(pattern, block)
-        if m:
-            # Unescape MEL string escape sequences
-            s = m.group(1)
-            s = s.replace('\\\\', '\x00')  # Temp placeholder for literal backslash
-            s = s.replace('\\n', '\n')
-            s = s.replace('\\t', '\t')
-            s = s.replace('\\r', '\r')
-            s = s.replace('\\"', '"')
-            s = s.replace('\x00', '\\')  # Restore literal backslashes
-            return s
-        return None
-
-    # Extract numeric flags (space-separated values)
-    def get_numeric_flags(flag_name, count):
-        pattern = r'-{}\s+'.format(flag_name)
-        m = re.search(pattern, block)
-        if not m:
-            return None
-        start = m.end()
-        # Extract numbers after the flag
-        remainder = block[start:]
-        nums = []
-        for part in remainder.split():
-            if part.startswith('-') and not part[1:].replace('.', '').replace('-', '').isdigit():
-                break
-            try:
-                nums.append(float(part))
-                if len(nums) >= count:
-                    break
-            except ValueError:
-                break
-        return nums if len(nums) == count else None
-
-    # Parse main fields
-    annotation = get_string_flag("annotation")
-    if annotation:
-        btn["annotation"] = annotation
-
-    label = get_string_flag("label")
-    if label:
-        btn["name"] = label
-
-    # Icon overlay label text
-    overlay_label = get_string_flag("imageOverlayLabel")
-    if overlay_label:
-        btn["label"] = overlay_label
+    # First occurrence of each flag wins; values are unescaped only when used
+    strings = {}
+    numbers = {}
+    items = []
+    for mi_label, mi_cmd, name, str_val, num_val in _FLAG_LEXER.findall(block):
+        if mi_label:
+            items.append((mi_label, mi_cmd))
+        elif num_val:
+            numbers.setdefault(name, num_val)
+        elif name:
+            strings.setdefault(name, str_val)
+
+    for flag, key in _STRING_FIELDS:
+        value = strings.get(flag)
+        if value:
+            btn[key] = unescape_mel(value)
 
     # Icon - prefer image1, fallback to image
-    icon = get_string_flag("image1") or get_string_flag("image")
+    icon = strings.get("image1") or strings.get("image")
     if icon:
-        btn["icon"] = icon.replace("\\", "/")
-
-    # Command
-    command = get_string_flag("command")
-    if command:
-        btn["command"] = command
+        btn["icon"] = unescape_mel(icon).replace("\\", "/")
 
     # Source type (mel or python)
-    source_type = get_string_flag("sourceType")
+    source_type = strings.get("sourceType")
     if source_type:
-        btn["command_type"] = source_type.lower()
+        # Only a couple of distinct values, so share one string object between buttons
+        btn["command_type"] = sys.intern(unescape_mel(source_type).lower())
 
     # Double click command (secondary/shift command)
-    double_click = get_string_flag("doubleClickCommand")
+    double_click = strings.get("doubleClickCommand")
     if double_click:
-        btn["shift_command"] = double_click
+        btn["shift_command"] = unescape_mel(double_click)
         btn["shift_command_type"] = btn["command_type"]
 
     # Overlay label colors
-    label_color = get_numeric_flags("overlayLabelColor", 3)
-    if label_color:
-        btn["label_text_color"] = label_color
-
-    label_bg = get_numeric_flags("overlayLabelBackColor", 4)
-    if label_bg:
-        btn["label_bg_color"] = label_bg
-
-    # Parse submenu items: -mi "Label" ( "command" )
-    def unescape_mel(s):
-        s = s.replace('\\\\', '\x00')
-        s = s.replace('\\n', '\n')
-        s = s.replace('\\t', '\t')
-        s = s.replace('\\r', '\r')
-        s = s.replace('\\"', '"')
-        s = s.replace('\x00', '\\')
-        return s
+    for flag, key, count in _NUMERIC_FIELDS:
+        value = numbers.get(flag)
+        if value:
+            parts = value.split()
+            if len(parts) >= count:
+                btn[key] = [float(v) for v in parts[:count]]
+
+    if items:
+        cmd_type = btn["command_type"]
+        btn["submenu"] = [
+            {"label": label_text, "command": unescape_mel(cmd), "type": cmd_type}
+            for label_text, cmd in items
+        ]
 
-    submenu = []
-    mi_pattern = re.compile(r'-mi\s+"([^"]+)"\s*\(\s*"((?:[^"\\]|\\.)*)"\s*\)')
-    for m in mi_pattern.finditer(block):
-        label_text = m.group(1)
-        cmd = unescape_mel(m.group(2))
-        submenu.append({
-            "label": label_text,
-            "command": cmd,
-            "type": btn["command_type"]
-        })
+    return btn
 
-    if submenu:
-        btn["submenu"] = submenu
 
-    return btn
+def _try_parse_shelf_mel(path):
+    # Return (result, exception) so one bad file doesn't abort the pool's map
+    try:
+        return parse_shelf_mel(path), None
+    except Exception as e:
+        return None, e
 
 
 def import_shelf_files(parent=None):
@@ -195,13 +265,26 @@ def import_shelf_files(parent=None):
 
     imported = []
     errors = []
-
-    for path in file_paths:
+    existing = set(core.get_all_shelf_names())
+
+    # Parsing is pure file and string work, so it runs on a thread pool;
+    # every config/Maya call below stays on the main thread
+    get_cache_dir()
+    if len(file_paths) > 1:
+        workers = min(MAX_PARSE_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            parsed = list(ex.map(_try_parse_shelf_mel, file_paths))
+    else:
+        parsed = [_try_parse_shelf_mel(p) for p in file_paths]
+
+    for path, (result, error) in zip(file_paths, parsed):
+        if error is not None:
+            errors.append("{}: {}".format(os.path.basename(path), str(error)))
+            continue
         try:
-            shelf_name, buttons = parse_shelf_mel(path)
+            shelf_name, buttons = result
 
             # Check if shelf already exists
-            existing = core.get_all_shelf_names()
             original_name = shelf_name
             counter = 1
             while shelf_name in existing:
@@ -209,10 +292,11 @@ def import_shelf_files(parent=None):
                 counter += 1
 
             # Create shelf and add buttons
-            core.create_shelf(shelf_name)
-            for btn in buttons:
-                core.add_button_to_shelf(shelf_name, btn)
+            with core.batch_edits():
+                core.create_shelf(shelf_name)
+                core.add_buttons_to_shelf(shelf_name, buttons)
 
+            existing.add(shelf_name)
             imported.append(shelf_name)
 
         except Exception as e:
@@ -1,40 +1,163 @@
 try:
-    from PySide6.QtCore import Qt, Signal, QEvent
+    from PySide6.QtCore import Qt, Signal, Slot, QEvent, QTimer, QModelIndex, QSignalBlocker
     from PySide6.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget,
         QListWidgetItem, QPushButton, QLabel, QLineEdit, QFormLayout,
-        QComboBox, QTextEdit, QWidget, QMenu, QStackedWidget,
-        QInputDialog, QMessageBox, QToolButton, QSpinBox, QSlider,
-        QTabWidget, QRadioButton, QButtonGroup, QSizePolicy, QFrame,
+        QComboBox, QPlainTextEdit, QWidget, QMenu, QStackedWidget,
+        QInputDialog, QMessageBox, QSpinBox, QSlider,
+        QTabWidget, QRadioButton, QButtonGroup, QSizePolicy,
         QAbstractItemView, QColorDialog, QCheckBox
     )
-    from PySide6.QtGui import QIcon, QColor
+    from PySide6.QtGui import QAction, QIcon, QColor, QPainter, QPalette, QStandardItemModel, QStandardItem
 except ImportError:
-    from PySide2.QtCore import Qt, Signal, QEvent
+    from PySide2.QtCore import Qt, Signal, Slot, QEvent, QTimer, QModelIndex, QSignalBlocker
     from PySide2.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget,
         QListWidgetItem, QPushButton, QLabel, QLineEdit, QFormLayout,
-        QComboBox, QTextEdit, QWidget, QMenu, QStackedWidget,
-        QInputDialog, QMessageBox, QToolButton, QSpinBox, QSlider,
-        QTabWidget, QRadioButton, QButtonGroup, QSizePolicy, QFrame,
-        QAbstractItemView, QColorDialog, QCheckBox
+        QComboBox, QPlainTextEdit, QWidget, QMenu, QStackedWidget,
+        QInputDialog, QMessageBox, QSpinBox, QSlider,
+        QTabWidget, QRadioButton, QButtonGroup, QSizePolicy,
+        QAbstractItemView, QColorDialog, QCheckBox, QAction
     )
-    from PySide2.QtGui import QIcon, QColor
+    from PySide2.QtGui import QIcon, QColor, QPainter, QPalette, QStandardItemModel, QStandardItem
+
+import collections
+import contextlib
+import functools
 
 import maya.cmds as cmds
 from . import core
 from . import widgets
 
+
+# One sheet for the manager and the dialogs it opens, installed on the top-level
+# dialog only; widgets opt in through the "role"/"active" properties instead of
+# carrying stylesheets of their own
+_STYLESHEET = """
+    QLineEdit:disabled, QPlainTextEdit:disabled, QSpinBox:disabled,
+    QComboBox:disabled, QSlider:disabled {
+        background-color: rgb(56, 56, 56);
+        color: rgb(100, 100, 100);
+    }
+    QPushButton:disabled {
+        background-color: rgb(56, 56, 56);
+        color: rgb(100, 100, 100);
+    }
+    QRadioButton:disabled {
+        color: rgb(100, 100, 100);
+    }
+    QPushButton[role="primary"] { background-color: #337928; }
+    QPushButton[role="danger"] { background-color: #792425; }
+    QLabel[role="hint"] { color: #888; }
+    QLabel[role="ok"] { color: #4a4; }
+    QLabel[role="err"] { color: #a44; }
+    QListWidget[active="true"] { background-color: rgb(19, 22, 23); }
+"""
+
 _manager_instance = None
 
 
+def _panel_name(shelf_name):
+    # widgets owns the naming rule for panels and their workspaceControls
+    return widgets._panel_names(shelf_name)[1]
+
+
+def _set_style_property(widget, name, value):
+    """Set a dynamic property used by a stylesheet selector and restyle the widget."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    # Property selectors are only re-evaluated on polish
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+@contextlib.contextmanager
+def _signals_blocked(*widgets_to_block):
+    """Block signals on all given widgets for the duration of the block."""
+    blockers = [QSignalBlocker(w) for w in widgets_to_block]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+def _make_button(text, on_click=None, role=None):
+    # role picks up the matching QPushButton[role=...] rule in _STYLESHEET
+    button = QPushButton(text)
+    if role:
+        button.setProperty("role", role)
+    if on_click:
+        button.clicked.connect(on_click)
+    return button
+
+
+def _clone_button(btn):
+    # Button values are JSON primitives plus color lists and the submenu
+    # list of flat dicts, so one level of copying is enough
+    clone = dict(btn)
+    for key, val in btn.items():
+        if isinstance(val, list):
+            clone[key] = [dict(v) if isinstance(v, dict) else v for v in val]
+    return clone
+
+
+def _make_command_edit():
+    # Commands are plain source, so skip QTextEdit's rich text machinery
+    edit = QPlainTextEdit()
+    edit.document().setDocumentMargin(2)
+    edit.setTabStopDistance(edit.fontMetrics().horizontalAdvance(" ") * 4)
+    return edit
+
+
+class _ColorSwatch(QPushButton):
+    """Flat push button that paints its own fill, so recoloring needs no stylesheet."""
+
+    _BORDER = QColor(85, 85, 85)
+    _DISABLED_BG = QColor(56, 56, 56)
+    _DISABLED_TEXT = QColor(100, 100, 100)
+
+    def __init__(self, parent=None):
+        super(_ColorSwatch, self).__init__(parent)
+        self._fill = None
+
+    def setFill(self, color):
+        self._fill = color
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.rect().adjusted(0, 0, -1, -1)
+        enabled = self.isEnabled()
+        if not enabled:
+            painter.fillRect(rect, self._DISABLED_BG)
+        elif self._fill is not None:
+            painter.fillRect(rect, self._fill)
+        painter.setPen(self._BORDER)
+        painter.drawRect(rect)
+        if self.text():
+            painter.setPen(self.palette().color(QPalette.ButtonText) if enabled else self._DISABLED_TEXT)
+            painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+        painter.end()
+
+
 class ColorButtonWithSlider(QWidget):
     colorChanged = Signal(list)
 
+    # Slider drags restyle and emit at most this often
+    SLIDER_INTERVAL_MS = 30
+
     def __init__(self, support_alpha=False, parent=None):
         super(ColorButtonWithSlider, self).__init__(parent)
+        # _color is the list handed to callers; _qcolor mirrors it for painting
+        # and is all a slider drag touches until the change is flushed
         self._color = None
+        self._qcolor = None
+        self._has_alpha = False
         self._support_alpha = support_alpha
+        self._pending = False
         self._build_ui()
 
     def _build_ui(self):
@@ -42,7 +165,7 @@ class ColorButtonWithSlider(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
 
-        self._color_btn = QPushButton()
+        self._color_btn = _ColorSwatch()
         self._color_btn.setFixedSize(120, 24)
         self._color_btn.clicked.connect(self._pick_color)
         layout.addWidget(self._color_btn)
@@ -53,8 +176,14 @@ class ColorButtonWithSlider(QWidget):
             self._slider.setValue(100)
             self._slider.setMinimumWidth(80)
             self._slider.valueChanged.connect(self._on_slider_changed)
+            self._slider.sliderReleased.connect(self._flush_color)
             layout.addWidget(self._slider, 1)
 
+            self._emit_timer = QTimer(self)
+            self._emit_timer.setSingleShot(True)
+            self._emit_timer.setInterval(self.SLIDER_INTERVAL_MS)
+            self._emit_timer.timeout.connect(self._flush_color)
+
             self._alpha_label = QLabel("100%")
             self._alpha_label.setFixedWidth(40)
             layout.addWidget(self._alpha_label)
@@ -67,65 +196,115 @@ class ColorButtonWithSlider(QWidget):
         layout.addStretch()
         self._update_style()
 
+    def _set_color(self, color):
+        self._color = color
+        if not color:
+            self._qcolor = None
+            self._has_alpha = False
+        else:
+            self._has_alpha = self._support_alpha and len(color) > 3
+            self._qcolor = QColor.fromRgbF(color[0], color[1], color[2])
+            if self._has_alpha:
+                self._qcolor.setAlphaF(color[3])
+
+    def _sync_color(self):
+        # Fold the slider's alpha back into the list form
+        self._color = [self._color[0], self._color[1], self._color[2], self._slider.value() / 100.0]
+
     def _update_style(self):
-        disabled_style = "QPushButton:disabled { background-color: rgb(56, 56, 56); color: rgb(100, 100, 100); }"
-        if self._color:
-            r, g, b = [int(c * 255) for c in self._color[:3]]
-            if self._support_alpha and len(self._color) > 3:
-                a = int(self._color[3] * 255)
-                self._color_btn.setStyleSheet(
-                    "QPushButton {{ background-color: rgba({},{},{},{}); border: 1px solid #555; }} {}".format(r, g, b, a, disabled_style))
-            else:
-                self._color_btn.setStyleSheet(
-                    "QPushButton {{ background-color: rgb({},{},{}); border: 1px solid #555; }} {}".format(r, g, b, disabled_style))
+        c = self._qcolor
+        if c is not None:
+            # Copy, since slider steps edit _qcolor's alpha ahead of the flush
+            self._color_btn.setFill(QColor(c) if self._has_alpha else QColor(c.rgb()))
             self._color_btn.setText("")
         else:
-            self._color_btn.setStyleSheet("QPushButton {{ border: 1px solid #555; }} {}".format(disabled_style))
+            self._color_btn.setFill(None)
             self._color_btn.setText("None")
 
+    @Slot()
     def _pick_color(self):
         initial = QColor(127, 127, 127)
-        if self._color:
-            initial = QColor(int(self._color[0] * 255), int(self._color[1] * 255), int(self._color[2] * 255))
+        if self._qcolor is not None:
+            initial = QColor(self._qcolor.rgb())
 
         # Use top-level window as parent so dialog inherits WindowStaysOnTopHint
         parent_window = self.window()
         color = QColorDialog.getColor(initial, parent_window, "Select Color")
 
         if color.isValid():
+            self._cancel_pending()
             rgb = [color.redF(), color.greenF(), color.blueF()]
             if self._support_alpha:
-                alpha = self._slider.value() / 100.0
-                self._color = [rgb[0], rgb[1], rgb[2], alpha]
-            else:
-                self._color = rgb
+                rgb.append(self._slider.value() / 100.0)
+            self._set_color(rgb)
             self._update_style()
             self.colorChanged.emit(self._color)
 
+    @Slot(int)
     def _on_slider_changed(self, value):
         self._alpha_label.setText("{}%".format(value))
-        if self._color and len(self._color) >= 3:
-            self._color = [self._color[0], self._color[1], self._color[2], value / 100.0]
-            self._update_style()
-            self.colorChanged.emit(self._color)
+        if self._qcolor is not None:
+            self._qcolor.setAlphaF(value / 100.0)
+            self._has_alpha = True
+            # Coalesce drag steps; the timer is not restarted so updates keep flowing
+            self._pending = True
+            if not self._emit_timer.isActive():
+                self._emit_timer.start()
+
+    @Slot()
+    def _flush_color(self):
+        if not self._pending:
+            return
+        self._pending = False
+        self._emit_timer.stop()
+        self._sync_color()
+        self._update_style()
+        self.colorChanged.emit(self._color)
+
+    def _cancel_pending(self):
+        # A pending emit belongs to whatever was selected before; drop it
+        self._pending = False
+        if self._support_alpha:
+            self._emit_timer.stop()
 
     def color(self):
+        if self._pending:
+            self._sync_color()
         return self._color
 
     def setColor(self, color):
-        self._color = color
-        if self._support_alpha and color and len(color) > 3:
-            self._slider.blockSignals(True)
-            self._slider.setValue(int(color[3] * 100))
-            self._alpha_label.setText("{}%".format(int(color[3] * 100)))
-            self._slider.blockSignals(False)
-        self._update_style()
+        self.reset(color)
+
+    def reset(self, color):
+        """Reuse this widget for another color without emitting colorChanged."""
+        self._cancel_pending()
+        self._set_color(color)
+        # Slider, label and swatch change together; repaint them once
+        self.setUpdatesEnabled(False)
+        try:
+            if self._support_alpha:
+                # Colors without alpha start from opaque rather than the previous
+                # selection's slider position
+                alpha = int(color[3] * 100) if color and len(color) > 3 else 100
+                self._slider.blockSignals(True)
+                self._slider.setValue(alpha)
+                self._alpha_label.setText("{}%".format(alpha))
+                self._slider.blockSignals(False)
+            self._update_style()
+        finally:
+            self.setUpdatesEnabled(True)
 
+    @Slot()
     def clear_color(self):
-        self._color = None
-        if self._support_alpha:
-            self._slider.setValue(100)
-        self._update_style()
+        self._cancel_pending()
+        self._set_color(None)
+        self.setUpdatesEnabled(False)
+        try:
+            if self._support_alpha:
+                self._slider.setValue(100)
+            self._update_style()
+        finally:
+            self.setUpdatesEnabled(True)
         self.colorChanged.emit(self._color)
 
 
@@ -146,12 +325,21 @@ class TriggerSettingsDialog(QDialog):
         ("not_set", "Not set"),
     ]
 
+    # Row of each trigger in the shared combo model
+    _TRIGGER_INDEX = {key: i for i, (key, _) in enumerate(TRIGGERS)}
+
     def __init__(self, parent=None):
         super(TriggerSettingsDialog, self).__init__(parent)
         self.setWindowTitle("Set Trigger Mechanism")
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
         self.setFixedWidth(400)
+        # Opened from the manager it already inherits the shared sheet
+        if parent is None:
+            self.setStyleSheet(_STYLESHEET)
         self._combos = {}
+        # action -> trigger, and trigger -> owning action (set triggers only)
+        self._values = {}
+        self._owners = {}
         self._build_ui()
         self._load_settings()
 
@@ -164,11 +352,17 @@ class TriggerSettingsDialog(QDialog):
         form.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
         form.setLabelAlignment(Qt.AlignRight)
 
+        # All combos list the same triggers, so they share one model
+        self._triggers_model = QStandardItemModel(self)
+        for trig_key, trig_label in self.TRIGGERS:
+            item = QStandardItem(trig_label)
+            item.setData(trig_key, Qt.UserRole)
+            self._triggers_model.appendRow(item)
+
         for key, label in self.ACTIONS:
             combo = QComboBox()
-            for trig_key, trig_label in self.TRIGGERS:
-                combo.addItem(trig_label, trig_key)
-            combo.currentIndexChanged.connect(lambda idx, k=key: self._on_combo_changed(k))
+            combo.setModel(self._triggers_model)
+            combo.currentIndexChanged.connect(functools.partial(self._on_combo_changed, key))
             self._combos[key] = combo
             form.addRow(label + ":", combo)
 
@@ -176,7 +370,7 @@ class TriggerSettingsDialog(QDialog):
 
         # Validation message
         self._validation_label = QLabel("All options must be unique and set before saving.")
-        self._validation_label.setStyleSheet("color: #888;")
+        self._validation_label.setProperty("role", "hint")
         layout.addWidget(self._validation_label)
 
         # Buttons
@@ -195,74 +389,102 @@ class TriggerSettingsDialog(QDialog):
 
     def _load_settings(self):
         triggers = core.get_trigger_settings()
+        # Block every combo once for the whole load
+        blockers = [QSignalBlocker(combo) for combo in self._combos.values()]
+        values = {}
         for key, combo in self._combos.items():
             val = triggers.get(key, "not_set")
-            idx = combo.findData(val)
-            if idx >= 0:
+            idx = self._TRIGGER_INDEX.get(val)
+            if idx is not None:
                 combo.setCurrentIndex(idx)
+            else:
+                val = self.TRIGGERS[combo.currentIndex()][0]
+            values[key] = val
+        for blocker in blockers:
+            blocker.unblock()
+
+        self._values = {}
+        self._owners = {}
+        for key, val in values.items():
+            self._assign(key, val)
         self._update_validation()
 
-    def _on_combo_changed(self, changed_key):
-        changed_combo = self._combos[changed_key]
-        new_val = changed_combo.currentData()
+    def _assign(self, key, val):
+        previous = self._values.get(key)
+        if self._owners.get(previous) == key:
+            del self._owners[previous]
+        self._values[key] = val
 
         # If new value is "not_set", no conflict possible
-        if new_val == "not_set":
-            self._update_validation()
+        if val == "not_set":
             return
 
-        # Auto-clear any other combo that has the same value
-        for key, combo in self._combos.items():
-            if key != changed_key and combo.currentData() == new_val:
-                not_set_idx = combo.findData("not_set")
-                combo.blockSignals(True)
-                combo.setCurrentIndex(not_set_idx)
-                combo.blockSignals(False)
-
+        # Auto-clear the other combo that has the same value
+        owner = self._owners.get(val)
+        if owner is not None:
+            combo = self._combos[owner]
+            blocker = QSignalBlocker(combo)
+            combo.setCurrentIndex(self._TRIGGER_INDEX["not_set"])
+            blocker.unblock()
+            self._values[owner] = "not_set"
+        self._owners[val] = key
+
+    def _on_combo_changed(self, changed_key, index):
+        self._assign(changed_key, self.TRIGGERS[index][0])
         self._update_validation()
 
     def _update_validation(self):
         valid = self._is_valid()
         self._save_btn.setEnabled(valid)
         if valid:
-            self._validation_label.setStyleSheet("color: #4a4;")
+            _set_style_property(self._validation_label, "role", "ok")
             self._validation_label.setText("Settings are valid and can be saved.")
         else:
-            self._validation_label.setStyleSheet("color: #a44;")
+            _set_style_property(self._validation_label, "role", "err")
             self._validation_label.setText("All options must be unique and set before saving.")
 
     def _is_valid(self):
-        values = []
-        for combo in self._combos.values():
-            val = combo.currentData()
-            if val == "not_set":
-                return False
-            if val in values:
-                return False
-            values.append(val)
-        return True
+        # Owners only holds set triggers, one action each, so a full map means
+        # every action is set and no two share a trigger
+        return len(self._owners) == len(self.ACTIONS)
 
+    @Slot()
     def _save_and_close(self):
         if not self._is_valid():
             return
-        triggers = {}
-        for key, combo in self._combos.items():
-            triggers[key] = combo.currentData()
-        core.set_trigger_settings(triggers)
+        core.set_trigger_settings(dict(self._values))
         self.close()
 
 
 class ShelfManager(QDialog):
 
+    # Typing in the property editors is written back at most this often
+    PROP_SAVE_DELAY_MS = 150
+    ICON_CACHE_SIZE = 512
+
+    # Button list icons by icon path, shared across manager instances
+    _icon_cache = collections.OrderedDict()
+
     def __init__(self, parent=None, select_shelf=None, select_button=None):
         super(ShelfManager, self).__init__(parent)
         self._current_shelf = None
         self._current_button_indices = []
+        # (shelf name, shelf dict) from the last lookup; see _current_shelf_data
+        self._shelf_data_cache = None
+        # Shelf list display name -> row, rebuilt with the list
+        self._shelf_row_index = {}
+        # Button list rows holding separators, kept in step with the rows
+        self._separator_rows = set()
         self._select_shelf = select_shelf
         self._select_button = select_button
         self._clipboard = None
         self._submenu_items = []
 
+        self._prop_timer = QTimer(self)
+        self._prop_timer.setSingleShot(True)
+        self._prop_timer.setInterval(self.PROP_SAVE_DELAY_MS)
+        self._prop_timer.timeout.connect(self._flush_button_props)
+
         self.setWindowTitle("Neo Shelf Manager v1.0")
         self.setMinimumSize(1425, 1225)
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
@@ -287,21 +509,8 @@ class ShelfManager(QDialog):
     def _build_ui(self):
         main_layout = QVBoxLayout(self)
 
-        # Style disabled fields to match background
-        self.setStyleSheet("""
-            QLineEdit:disabled, QTextEdit:disabled, QSpinBox:disabled,
-            QComboBox:disabled, QSlider:disabled {
-                background-color: rgb(56, 56, 56);
-                color: rgb(100, 100, 100);
-            }
-            QPushButton:disabled {
-                background-color: rgb(56, 56, 56);
-                color: rgb(100, 100, 100);
-            }
-            QRadioButton:disabled {
-                color: rgb(100, 100, 100);
-            }
-        """)
+        # Style disabled fields to match background, plus the role/active selectors
+        self.setStyleSheet(_STYLESHEET)
 
         # Main vertical splitter (columns on top, options below)
         self._main_splitter = QSplitter(Qt.Vertical)
@@ -321,7 +530,9 @@ class ShelfManager(QDialog):
         self._shelf_list = QListWidget()
         self._shelf_list.currentRowChanged.connect(self._on_shelf_selected)
         self._shelf_list.itemClicked.connect(self._on_shelf_clicked)
-        self._shelf_list.viewport().installEventFilter(self)
+        # Kept so eventFilter can compare by identity
+        self._shelf_viewport = self._shelf_list.viewport()
+        self._shelf_viewport.installEventFilter(self)
         shelf_layout.addWidget(self._shelf_list)
         top_splitter.addWidget(self._shelf_widget)
 
@@ -336,7 +547,8 @@ class ShelfManager(QDialog):
         self._button_list.itemClicked.connect(self._on_button_clicked)
         self._button_list.setDragDropMode(QListWidget.InternalMove)
         self._button_list.model().rowsMoved.connect(self._on_buttons_reordered)
-        self._button_list.viewport().installEventFilter(self)
+        self._button_viewport = self._button_list.viewport()
+        self._button_viewport.installEventFilter(self)
         button_layout.addWidget(self._button_list)
         top_splitter.addWidget(self._button_widget)
 
@@ -387,36 +599,29 @@ class ShelfManager(QDialog):
         # Buttons row
         btn_row = QHBoxLayout()
 
-        self._shelf_open_btn = QPushButton("Open")
-        self._shelf_open_btn.setStyleSheet("QPushButton { background-color: #337928; }")
-        self._shelf_open_btn.clicked.connect(self._open_shelf_panel)
+        self._shelf_open_btn = _make_button("Open", self._open_shelf_panel, role="primary")
         btn_row.addWidget(self._shelf_open_btn)
 
-        self._shelf_new_btn = QPushButton("New")
-        self._shelf_new_btn.clicked.connect(self._create_shelf)
+        self._shelf_new_btn = _make_button("New", self._create_shelf)
         btn_row.addWidget(self._shelf_new_btn)
 
-        self._shelf_dup_btn = QPushButton("Duplicate")
-        self._shelf_dup_btn.clicked.connect(self._duplicate_shelf)
+        self._shelf_dup_btn = _make_button("Duplicate", self._duplicate_shelf)
         btn_row.addWidget(self._shelf_dup_btn)
 
-        self._shelf_refresh_btn = QPushButton("Refresh Panel")
-        self._shelf_refresh_btn.clicked.connect(self._refresh_current_panel)
+        self._shelf_refresh_btn = _make_button("Refresh Panel", self._refresh_current_panel)
         btn_row.addWidget(self._shelf_refresh_btn)
 
-        self._shelf_close_btn = QPushButton("Close Panel")
-        self._shelf_close_btn.clicked.connect(self._close_shelf_panel)
+        self._shelf_close_btn = _make_button("Close Panel", self._close_shelf_panel)
         btn_row.addWidget(self._shelf_close_btn)
 
-        self._shelf_delete_btn = QPushButton("Delete")
-        self._shelf_delete_btn.setStyleSheet("QPushButton { background-color: #792425; }")
-        self._shelf_delete_btn.clicked.connect(self._delete_shelf)
+        self._shelf_delete_btn = _make_button("Delete", self._delete_shelf, role="danger")
         btn_row.addWidget(self._shelf_delete_btn)
 
         btn_row.addStretch()
         layout.addLayout(btn_row)
 
-        # Settings form
+        # Settings form; only Expanding fields grow, so the spin box and
+        # combos keep their size hint without wrapper layouts
         form = QFormLayout()
         form.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
 
@@ -431,14 +636,11 @@ class ShelfManager(QDialog):
         form.addRow("Name:", name_row)
 
         # Icon size
-        size_row = QHBoxLayout()
         self._shelf_icon_size = QSpinBox()
         self._shelf_icon_size.setRange(10, 150)
         self._shelf_icon_size.setValue(55)
         self._shelf_icon_size.valueChanged.connect(self._on_shelf_setting_changed)
-        size_row.addWidget(self._shelf_icon_size)
-        size_row.addStretch()
-        form.addRow("Icon Size:", size_row)
+        form.addRow("Icon Size:", self._shelf_icon_size)
 
         # BG Color
         self._shelf_bg_color = ColorButtonWithSlider(support_alpha=True)
@@ -451,22 +653,16 @@ class ShelfManager(QDialog):
         form.addRow("Highlight:", self._shelf_highlight_color)
 
         # Alignment
-        align_row = QHBoxLayout()
         self._shelf_alignment = QComboBox()
         self._shelf_alignment.addItems(["left", "center", "right"])
         self._shelf_alignment.currentTextChanged.connect(self._on_shelf_setting_changed)
-        align_row.addWidget(self._shelf_alignment)
-        align_row.addStretch()
-        form.addRow("Alignment:", align_row)
+        form.addRow("Alignment:", self._shelf_alignment)
 
         # Layout
-        layout_row = QHBoxLayout()
         self._shelf_layout = QComboBox()
         self._shelf_layout.addItems(["horizontal", "vertical", "flow"])
         self._shelf_layout.currentTextChanged.connect(self._on_shelf_layout_changed)
-        layout_row.addWidget(self._shelf_layout)
-        layout_row.addStretch()
-        form.addRow("Layout:", layout_row)
+        form.addRow("Layout:", self._shelf_layout)
 
         # Hide highlight checkbox
         self._shelf_hide_highlight = QCheckBox(
@@ -485,48 +681,69 @@ class ShelfManager(QDialog):
 
         # Buttons row
         btn_row = QHBoxLayout()
-        self._btn_add = QPushButton("Add")
-        self._btn_add.clicked.connect(self._add_button)
+        self._btn_add = _make_button("Add", self._add_button)
         btn_row.addWidget(self._btn_add)
 
-        self._btn_add_sep = QPushButton("Add Sep")
-        self._btn_add_sep.clicked.connect(self._add_separator)
+        self._btn_add_sep = _make_button("Add Sep", self._add_separator)
         btn_row.addWidget(self._btn_add_sep)
 
-        self._btn_dup = QPushButton("Duplicate")
-        self._btn_dup.clicked.connect(self._duplicate_button)
+        self._btn_dup = _make_button("Duplicate", self._duplicate_button)
         btn_row.addWidget(self._btn_dup)
 
-        self._btn_del = QPushButton("Delete")
-        self._btn_del.setStyleSheet("QPushButton { background-color: #792425; }")
-        self._btn_del.clicked.connect(self._delete_button)
+        self._btn_del = _make_button("Delete", self._delete_button, role="danger")
         btn_row.addWidget(self._btn_del)
 
         # Transfer to menu button
         self._btn_transfer = QPushButton("Transfer to")
         self._transfer_menu = QMenu()
+        self._transfer_menu.aboutToShow.connect(self._update_transfer_menus)
+        self._transfer_menu.triggered.connect(self._on_transfer_menu_triggered)
         self._btn_transfer.setMenu(self._transfer_menu)
         btn_row.addWidget(self._btn_transfer)
 
         # Copy to menu button
         self._btn_copy_to = QPushButton("Copy to")
         self._copy_menu = QMenu()
+        self._copy_menu.aboutToShow.connect(self._update_transfer_menus)
+        self._copy_menu.triggered.connect(self._on_copy_menu_triggered)
         self._btn_copy_to.setMenu(self._copy_menu)
+        self._transfer_menus_key = None
         btn_row.addWidget(self._btn_copy_to)
 
         btn_row.addStretch()
         layout.addLayout(btn_row)
 
-        # Tabs
+        # Tabs; everything but Main is built the first time it is shown
         self._button_tabs = QTabWidget()
         self._button_tabs.addTab(self._build_main_tab(), "Main")
-        self._button_tabs.addTab(self._build_command_tab(), "Command")
-        self._button_tabs.addTab(self._build_secondary_tab(), "Secondary Command")
-        self._button_tabs.addTab(self._build_submenu_tab(), "Submenus")
+        self._pending_tabs = {
+            1: self._build_command_tab,
+            2: self._build_secondary_tab,
+            3: self._build_submenu_tab,
+        }
+        for label in ("Command", "Secondary Command", "Submenus"):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._button_tabs.addTab(page, label)
+        self._button_tabs.currentChanged.connect(self._ensure_tab_built)
         layout.addWidget(self._button_tabs)
 
         return widget
 
+    def _is_tab_built(self, index):
+        return index not in self._pending_tabs
+
+    @Slot(int)
+    def _ensure_tab_built(self, index):
+        builder = self._pending_tabs.pop(index, None)
+        if builder is None:
+            return
+        self._button_tabs.widget(index).layout().addWidget(builder())
+        # Fill the new editors from the current selection
+        self._flush_pending_props()
+        self._load_button_props()
+
     def _build_main_tab(self):
         widget = QWidget()
         layout = QFormLayout(widget)
@@ -584,7 +801,7 @@ class ShelfManager(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        self._cmd_edit = QTextEdit()
+        self._cmd_edit = _make_command_edit()
         self._cmd_edit.textChanged.connect(self._on_button_prop_changed)
         self._cmd_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self._cmd_edit, 1)
@@ -603,7 +820,7 @@ class ShelfManager(QDialog):
         layout.addLayout(type_row)
 
         self._cmd_unavailable = QLabel("Unavailable for separators")
-        self._cmd_unavailable.setStyleSheet("color: #888;")
+        self._cmd_unavailable.setProperty("role", "hint")
         self._cmd_unavailable.hide()
         layout.addWidget(self._cmd_unavailable)
 
@@ -613,7 +830,7 @@ class ShelfManager(QDialog):
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
-        self._shift_cmd_edit = QTextEdit()
+        self._shift_cmd_edit = _make_command_edit()
         self._shift_cmd_edit.textChanged.connect(self._on_button_prop_changed)
         self._shift_cmd_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(self._shift_cmd_edit, 1)
@@ -632,7 +849,7 @@ class ShelfManager(QDialog):
         layout.addLayout(type_row)
 
         self._shift_unavailable = QLabel("Unavailable for separators")
-        self._shift_unavailable.setStyleSheet("color: #888;")
+        self._shift_unavailable.setProperty("role", "hint")
         self._shift_unavailable.hide()
         layout.addWidget(self._shift_unavailable)
 
@@ -674,7 +891,7 @@ class ShelfManager(QDialog):
         right_layout = QVBoxLayout(right_widget)
         right_layout.setContentsMargins(5, 0, 0, 0)
 
-        self._sub_cmd_edit = QTextEdit()
+        self._sub_cmd_edit = _make_command_edit()
         self._sub_cmd_edit.textChanged.connect(self._on_submenu_changed)
         self._sub_cmd_edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         right_layout.addWidget(self._sub_cmd_edit, 1)
@@ -712,20 +929,20 @@ class ShelfManager(QDialog):
         self._sub_mel.setEnabled(False)
 
         self._submenu_unavailable = QLabel("Unavailable for separators")
-        self._submenu_unavailable.setStyleSheet("color: #888;")
+        self._submenu_unavailable.setProperty("role", "hint")
         self._submenu_unavailable.hide()
         layout.addWidget(self._submenu_unavailable)
 
         return widget
 
     # Shelf list operations
-    def _is_panel_open(self, shelf_name):
-        panel_name = widgets.PANEL_PREFIX + shelf_name.replace(" ", "_") + "WorkspaceControl"
-        config = core.load_config()
-        return panel_name in config.get("panels", {})
+    def _is_panel_open(self, shelf_name, panels=None):
+        if panels is None:
+            panels = core.load_config().get("panels", {})
+        return _panel_name(shelf_name) in panels
 
-    def _get_shelf_display_name(self, shelf_name):
-        if self._is_panel_open(shelf_name):
+    def _get_shelf_display_name(self, shelf_name, panels=None):
+        if self._is_panel_open(shelf_name, panels):
             return shelf_name
         return "[CLOSED] " + shelf_name
 
@@ -747,17 +964,28 @@ class ShelfManager(QDialog):
         self._shelf_refresh_btn.setEnabled(is_open)
 
     def _refresh_shelf_list(self):
-        self._shelf_list.clear()
-        for name in core.get_all_shelf_names():
-            display = self._get_shelf_display_name(name)
-            self._shelf_list.addItem(QListWidgetItem(display))
+        # One config lookup for the whole list rather than one per shelf
+        panels = core.load_config().get("panels", {})
+        display_names = [self._get_shelf_display_name(n, panels) for n in core.get_all_shelf_names()]
+        self._shelf_row_index = {display: row for row, display in enumerate(display_names)}
+
+        # Repopulate in one call without repaints or selection churn in between;
+        # the selection is restored below with signals live
+        self._shelf_list.setUpdatesEnabled(False)
+        self._shelf_list.blockSignals(True)
+        try:
+            self._shelf_list.clear()
+            self._shelf_list.addItems(display_names)
+        finally:
+            self._shelf_list.blockSignals(False)
+            self._shelf_list.setUpdatesEnabled(True)
 
         selected = False
         if self._current_shelf:
-            display = self._get_shelf_display_name(self._current_shelf)
-            items = self._shelf_list.findItems(display, Qt.MatchExactly)
-            if items:
-                self._shelf_list.setCurrentItem(items[0])
+            display = self._get_shelf_display_name(self._current_shelf, panels)
+            row = self._shelf_row_index.get(display)
+            if row is not None:
+                self._shelf_list.setCurrentRow(row)
                 selected = True
 
         # Fallback: select first item if nothing selected
@@ -766,11 +994,14 @@ class ShelfManager(QDialog):
 
     def _select_shelf_by_name(self, name):
         display = self._get_shelf_display_name(name)
-        items = self._shelf_list.findItems(display, Qt.MatchExactly)
-        if items:
-            self._shelf_list.setCurrentItem(items[0])
+        row = self._shelf_row_index.get(display)
+        if row is not None:
+            self._shelf_list.setCurrentRow(row)
 
+    @Slot(int)
     def _on_shelf_selected(self, row):
+        self._flush_pending_props()
+        self._shelf_data_cache = None
         if row < 0:
             self._current_shelf = None
             self._refresh_button_list()
@@ -785,6 +1016,7 @@ class ShelfManager(QDialog):
         self._update_panel_buttons()
         self._options_stack.setCurrentIndex(0)
 
+    @Slot(QListWidgetItem)
     def _on_shelf_clicked(self, item):
         self._options_stack.setCurrentIndex(0)
         self._update_column_highlight(0)
@@ -793,46 +1025,37 @@ class ShelfManager(QDialog):
         if not self._current_shelf:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
+        shelf_data = self._current_shelf_data()
         if not shelf_data:
             return
 
-        self._shelf_name_edit.blockSignals(True)
-        self._shelf_icon_size.blockSignals(True)
-        self._shelf_alignment.blockSignals(True)
-        self._shelf_layout.blockSignals(True)
-        self._shelf_hide_highlight.blockSignals(True)
-
-        self._shelf_name_edit.setText(self._current_shelf)
-        self._shelf_icon_size.setValue(shelf_data.get("icon_size", 55))
-        self._shelf_bg_color.setColor(shelf_data.get("bg_color"))
-        self._shelf_highlight_color.setColor(shelf_data.get("active_highlight_color"))
-
-        alignment = shelf_data.get("alignment", "left")
-        idx = self._shelf_alignment.findText(alignment)
-        if idx >= 0:
-            self._shelf_alignment.setCurrentIndex(idx)
+        with _signals_blocked(self._shelf_name_edit, self._shelf_icon_size, self._shelf_alignment,
+                              self._shelf_layout, self._shelf_hide_highlight):
+            self._shelf_name_edit.setText(self._current_shelf)
+            self._shelf_icon_size.setValue(shelf_data.get("icon_size", 55))
+            self._shelf_bg_color.reset(shelf_data.get("bg_color"))
+            self._shelf_highlight_color.reset(shelf_data.get("active_highlight_color"))
 
-        layout = shelf_data.get("layout", "horizontal")
-        idx = self._shelf_layout.findText(layout)
-        if idx >= 0:
-            self._shelf_layout.setCurrentIndex(idx)
+            alignment = shelf_data.get("alignment", "left")
+            idx = self._shelf_alignment.findText(alignment)
+            if idx >= 0:
+                self._shelf_alignment.setCurrentIndex(idx)
 
-        self._shelf_hide_highlight.setChecked(shelf_data.get("hide_highlight", False))
+            layout = shelf_data.get("layout", "horizontal")
+            idx = self._shelf_layout.findText(layout)
+            if idx >= 0:
+                self._shelf_layout.setCurrentIndex(idx)
 
-        self._update_alignment_enabled()
+            self._shelf_hide_highlight.setChecked(shelf_data.get("hide_highlight", False))
 
-        self._shelf_name_edit.blockSignals(False)
-        self._shelf_icon_size.blockSignals(False)
-        self._shelf_alignment.blockSignals(False)
-        self._shelf_layout.blockSignals(False)
-        self._shelf_hide_highlight.blockSignals(False)
+            self._update_alignment_enabled()
 
     def _update_alignment_enabled(self):
         layout_mode = self._shelf_layout.currentText()
         # Alignment only works in horizontal mode
         self._shelf_alignment.setEnabled(layout_mode == "horizontal")
 
+    @Slot()
     def _on_shelf_setting_changed(self):
         if not self._current_shelf:
             return
@@ -846,12 +1069,15 @@ class ShelfManager(QDialog):
             hide_highlight=self._shelf_hide_highlight.isChecked()
         )
 
+    @Slot(str)
     def _on_shelf_layout_changed(self, text):
         self._update_alignment_enabled()
         if self._current_shelf:
             core.update_shelf_settings(self._current_shelf, layout=text)
 
+    @Slot()
     def _save_shelf_name(self):
+        self._flush_pending_props()
         if not self._current_shelf:
             return
 
@@ -859,7 +1085,7 @@ class ShelfManager(QDialog):
         if not new_name or new_name == self._current_shelf:
             return
 
-        if new_name in core.get_all_shelf_names():
+        if core.shelf_exists(new_name):
             QMessageBox.warning(self, "Error", "Shelf '{}' already exists.".format(new_name))
             self._shelf_name_edit.setText(self._current_shelf)
             return
@@ -868,22 +1094,26 @@ class ShelfManager(QDialog):
         self._current_shelf = new_name
         self._refresh_shelf_list()
 
+    @Slot()
     def _create_shelf(self):
+        self._flush_pending_props()
         name, ok = QInputDialog.getText(self, "New Shelf", "Shelf name:")
         if ok and name:
             name = name.strip()
-            if name in core.get_all_shelf_names():
+            if core.shelf_exists(name):
                 QMessageBox.warning(self, "Error", "Shelf '{}' already exists.".format(name))
                 return
             core.create_shelf(name)
             self._current_shelf = name
             self._refresh_shelf_list()
 
+    @Slot()
     def _duplicate_shelf(self):
+        self._flush_pending_props()
         if not self._current_shelf:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
+        shelf_data = self._current_shelf_data()
         if not shelf_data:
             return
 
@@ -891,22 +1121,24 @@ class ShelfManager(QDialog):
                                         text=self._current_shelf + "_copy")
         if ok and name:
             name = name.strip()
-            if name in core.get_all_shelf_names():
+            if core.shelf_exists(name):
                 QMessageBox.warning(self, "Error", "Shelf '{}' already exists.".format(name))
                 return
 
-            core.create_shelf(name)
-            import copy
-            new_data = copy.deepcopy(shelf_data)
-            new_data["buttons"] = copy.deepcopy(shelf_data.get("buttons", []))
-            core.update_shelf_settings(name, **{k: v for k, v in new_data.items() if k != "buttons"})
-            for btn in new_data.get("buttons", []):
-                core.add_button_to_shelf(name, btn)
+            settings = {k: list(v) if isinstance(v, list) else v
+                        for k, v in shelf_data.items() if k != "buttons"}
+            buttons = [_clone_button(b) for b in shelf_data.get("buttons", [])]
+            with core.batch_edits():
+                core.create_shelf(name)
+                core.update_shelf_settings(name, **settings)
+                core.add_buttons_to_shelf(name, buttons)
 
             self._current_shelf = name
             self._refresh_shelf_list()
 
+    @Slot()
     def _delete_shelf(self):
+        self._flush_pending_props()
         if not self._current_shelf:
             return
 
@@ -919,65 +1151,151 @@ class ShelfManager(QDialog):
             self._refresh_shelf_list()
             self._refresh_button_list()
 
+    @Slot()
     def _open_shelf_panel(self):
+        self._flush_pending_props()
         if self._current_shelf:
             widgets.create_panel(self._current_shelf)
             self._refresh_shelf_list()
             self._update_panel_buttons()
 
+    @Slot()
     def _close_shelf_panel(self):
         if self._current_shelf:
-            panel_name = widgets.PANEL_PREFIX + self._current_shelf.replace(" ", "_") + "WorkspaceControl"
-            widgets.close_panel(panel_name)
+            widgets.close_panel(_panel_name(self._current_shelf))
             self._refresh_shelf_list()
             self._update_panel_buttons()
 
+    @Slot()
     def _refresh_current_panel(self):
+        self._flush_pending_props()
         if self._current_shelf:
             widgets.refresh_all_panels()
 
+    def _current_shelf_data(self):
+        # core hands out the live config dict, so one lookup serves every
+        # handler until the shelf changes or the button list is rebuilt
+        if not self._current_shelf:
+            return None
+        cache = self._shelf_data_cache
+        if cache is None or cache[0] != self._current_shelf:
+            cache = (self._current_shelf, core.get_shelf_data(self._current_shelf))
+            self._shelf_data_cache = cache
+        return cache[1]
+
+    def _current_buttons(self):
+        # The live list from the config; core edits it in place, so it stays
+        # in step with the rows without a shadow copy to maintain
+        shelf_data = self._current_shelf_data()
+        return shelf_data.get("buttons", []) if shelf_data else []
+
     # Button list operations
+    @classmethod
+    def _get_icon(cls, icon_path):
+        cache = cls._icon_cache
+        icon = cache.get(icon_path)
+        if icon is not None:
+            cache.move_to_end(icon_path)
+            return icon
+
+        icon = QIcon(widgets.resolve_icon_path(icon_path))
+        cache[icon_path] = icon
+        # Oldest use goes first, so long sessions don't keep every icon ever shown
+        if len(cache) > cls.ICON_CACHE_SIZE:
+            cache.popitem(last=False)
+        return icon
+
     def _refresh_button_list(self):
+        self._flush_pending_props()
         self._button_list.clear()
         self._current_button_indices = []
+        self._shelf_data_cache = None
+        self._separator_rows = set()
 
         if not self._current_shelf:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
+        buttons = self._current_buttons()
+        self._update_separator_rows()
+        # Painting is held off while the rows go in, so the list repaints once
+        self._button_list.setUpdatesEnabled(False)
+        add_item = self._button_list.addItem
+        make_item = self._make_button_item
+        try:
+            for btn in buttons:
+                add_item(make_item(btn))
+        finally:
+            self._button_list.setUpdatesEnabled(True)
+
+    def _make_button_item(self, btn):
+        if btn.get("separator"):
+            return QListWidgetItem("--- Separator ---")
+        get = btn.get
+        icon_path = get("icon", "commandButton.png")
+        item = QListWidgetItem(get("name") or get("label") or get("icon", "Button"))
+        item.setIcon(self._get_icon(icon_path))
+        return item
+
+    def _update_separator_rows(self):
+        buttons = self._current_buttons()
+        self._separator_rows = {i for i, btn in enumerate(buttons) if btn.get("separator")}
+
+    def _add_button_item(self, row, btn):
+        # Single row edits touch one item instead of rebuilding the list
+        self._button_list.insertItem(row, self._make_button_item(btn))
+        if row < self._button_list.count() - 1:
+            self._separator_rows = {r + 1 if r >= row else r for r in self._separator_rows}
+        if btn.get("separator"):
+            self._separator_rows.add(row)
+
+    def _remove_button_items(self, rows):
+        self._button_list.blockSignals(True)
+        try:
+            for row in sorted(rows, reverse=True):
+                self._button_list.takeItem(row)
+        finally:
+            self._button_list.blockSignals(False)
+        self._update_separator_rows()
+        # Resync the selection once rather than once per removed row
+        self._on_button_selection_changed()
+
+    @Slot()
+    def _update_transfer_menus(self):
+        # Filled when one of the menus is about to open, and only rebuilt
+        # when the shelf names or the current shelf have changed since
+        names = core.get_all_shelf_names()
+        key = (self._current_shelf, tuple(names))
+        if key == self._transfer_menus_key:
             return
+        self._transfer_menus_key = key
 
-        buttons = shelf_data.get("buttons", [])
-        for i, btn in enumerate(buttons):
-            if btn.get("separator"):
-                item = QListWidgetItem("--- Separator ---")
-            else:
-                display = btn.get("name") or btn.get("label") or btn.get("icon", "Button")
-                item = QListWidgetItem(display)
-                icon_path = btn.get("icon", "commandButton.png")
-                if not ("/" in icon_path or "\\" in icon_path):
-                    item.setIcon(QIcon(":{}".format(icon_path)))
-                else:
-                    item.setIcon(QIcon(icon_path))
-            self._button_list.addItem(item)
-
-        self._update_transfer_menus()
-
-    def _update_transfer_menus(self):
-        self._transfer_menu.clear()
+        # Each menu owns its actions: a QMenu emits triggered for every action
+        # added to it, so shared actions would fire both slots
         self._copy_menu.clear()
+        self._transfer_menu.clear()
 
-        for name in core.get_all_shelf_names():
+        for name in names:
             if name != self._current_shelf:
-                self._transfer_menu.addAction(name, lambda n=name: self._transfer_buttons(n))
-                self._copy_menu.addAction(name, lambda n=name: self._copy_buttons_to(n))
+                self._transfer_menu.addAction(name).setData(name)
+                self._copy_menu.addAction(name).setData(name)
+
+    @Slot(QAction)
+    def _on_transfer_menu_triggered(self, action):
+        self._transfer_buttons(action.data())
+
+    @Slot(QAction)
+    def _on_copy_menu_triggered(self, action):
+        self._copy_buttons_to(action.data())
 
+    @Slot()
     def _on_button_selection_changed(self):
-        self._current_button_indices = [idx.row() for idx in self._button_list.selectedIndexes()]
+        self._flush_pending_props()
+        # Kept in row order so the bulk operations can walk it as is
+        self._current_button_indices = sorted(idx.row() for idx in self._button_list.selectedIndexes())
         self._load_button_props()
         self._update_button_controls()
 
+    @Slot(QListWidgetItem)
     def _on_button_clicked(self, item):
         self._options_stack.setCurrentIndex(1)
         self._update_column_highlight(1)
@@ -985,13 +1303,8 @@ class ShelfManager(QDialog):
     def _update_column_highlight(self, active_col):
         # 0 = shelf column active, 1 = button column active
         # Apply to list widget only (not the header label)
-        active_style = "QListWidget { background-color: rgb(19, 22, 23); }"
-        if active_col == 0:
-            self._shelf_list.setStyleSheet(active_style)
-            self._button_list.setStyleSheet("")
-        else:
-            self._shelf_list.setStyleSheet("")
-            self._button_list.setStyleSheet(active_style)
+        _set_style_property(self._shelf_list, "active", active_col == 0)
+        _set_style_property(self._button_list, "active", active_col == 1)
 
     def _update_button_controls(self):
         count = len(self._current_button_indices)
@@ -999,15 +1312,7 @@ class ShelfManager(QDialog):
         has_selection = count > 0
 
         # Check if any separator is in selection
-        has_separator = False
-        if self._current_shelf and has_selection:
-            shelf_data = core.get_shelf_data(self._current_shelf)
-            if shelf_data:
-                buttons = shelf_data.get("buttons", [])
-                for idx in self._current_button_indices:
-                    if idx < len(buttons) and buttons[idx].get("separator"):
-                        has_separator = True
-                        break
+        has_separator = not self._separator_rows.isdisjoint(self._current_button_indices)
 
         # Single separator selected
         single_separator = count == 1 and has_separator
@@ -1046,16 +1351,7 @@ class ShelfManager(QDialog):
         self._btn_label_text_color.setEnabled(colors_enabled)
 
     def _load_button_props(self):
-        if not self._current_shelf:
-            self._clear_button_props()
-            return
-
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            self._clear_button_props()
-            return
-
-        buttons = shelf_data.get("buttons", [])
+        buttons = self._current_buttons()
         count = len(self._current_button_indices)
 
         if count == 0:
@@ -1078,19 +1374,22 @@ class ShelfManager(QDialog):
         is_separator = btn.get("separator", False)
 
         # Show/hide unavailable labels
-        self._cmd_unavailable.setVisible(is_separator)
-        self._cmd_edit.setVisible(not is_separator)
-        self._cmd_python.setVisible(not is_separator)
-        self._cmd_mel.setVisible(not is_separator)
-
-        self._shift_unavailable.setVisible(is_separator)
-        self._shift_cmd_edit.setVisible(not is_separator)
-        self._shift_python.setVisible(not is_separator)
-        self._shift_mel.setVisible(not is_separator)
-
-        self._submenu_unavailable.setVisible(is_separator)
-        self._submenu_list.setVisible(not is_separator)
-        self._sub_cmd_edit.setVisible(not is_separator)
+        if self._is_tab_built(1):
+            self._cmd_unavailable.setVisible(is_separator)
+            self._cmd_edit.setVisible(not is_separator)
+            self._cmd_python.setVisible(not is_separator)
+            self._cmd_mel.setVisible(not is_separator)
+
+        if self._is_tab_built(2):
+            self._shift_unavailable.setVisible(is_separator)
+            self._shift_cmd_edit.setVisible(not is_separator)
+            self._shift_python.setVisible(not is_separator)
+            self._shift_mel.setVisible(not is_separator)
+
+        if self._is_tab_built(3):
+            self._submenu_unavailable.setVisible(is_separator)
+            self._submenu_list.setVisible(not is_separator)
+            self._sub_cmd_edit.setVisible(not is_separator)
 
         if is_separator:
             self._clear_button_props()
@@ -1099,39 +1398,39 @@ class ShelfManager(QDialog):
         # Block signals on all widgets that trigger _on_button_prop_changed
         widgets_to_block = [
             self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
-            self._btn_tooltip_edit, self._cmd_edit, self._shift_cmd_edit,
-            self._cmd_python, self._cmd_mel, self._shift_python, self._shift_mel
+            self._btn_tooltip_edit
         ]
-        for w in widgets_to_block:
-            w.blockSignals(True)
-
-        # Load submenu first (before radio buttons that might trigger signals)
-        self._submenu_items = list(btn.get("submenu", []))
-        self._refresh_submenu_list()
-
-        self._btn_name_edit.setText(btn.get("name", ""))
-        self._btn_icon_edit.setText(btn.get("icon", ""))
-        self._btn_label_edit.setText(btn.get("label", ""))
-        self._btn_tooltip_edit.setText(btn.get("annotation", ""))
-        self._btn_bg_color.setColor(btn.get("bg_color"))
-        self._btn_icon_tint.setColor(btn.get("icon_tint"))
-        self._btn_label_bg_color.setColor(btn.get("label_bg_color"))
-        self._btn_label_text_color.setColor(btn.get("label_text_color"))
-
-        self._cmd_edit.setPlainText(btn.get("command", ""))
-        if btn.get("command_type", "python") == "mel":
-            self._cmd_mel.setChecked(True)
-        else:
-            self._cmd_python.setChecked(True)
+        if self._is_tab_built(1):
+            widgets_to_block += [self._cmd_edit, self._cmd_python, self._cmd_mel]
+        if self._is_tab_built(2):
+            widgets_to_block += [self._shift_cmd_edit, self._shift_python, self._shift_mel]
+        with _signals_blocked(*widgets_to_block):
+            # Load submenu first (before radio buttons that might trigger signals)
+            self._submenu_items = list(btn.get("submenu", []))
+            self._refresh_submenu_list()
 
-        self._shift_cmd_edit.setPlainText(btn.get("shift_command", ""))
-        if btn.get("shift_command_type", "python") == "mel":
-            self._shift_mel.setChecked(True)
-        else:
-            self._shift_python.setChecked(True)
+            self._btn_name_edit.setText(btn.get("name", ""))
+            self._btn_icon_edit.setText(btn.get("icon", ""))
+            self._btn_label_edit.setText(btn.get("label", ""))
+            self._btn_tooltip_edit.setText(btn.get("annotation", ""))
+            self._btn_bg_color.reset(btn.get("bg_color"))
+            self._btn_icon_tint.reset(btn.get("icon_tint"))
+            self._btn_label_bg_color.reset(btn.get("label_bg_color"))
+            self._btn_label_text_color.reset(btn.get("label_text_color"))
+
+            if self._is_tab_built(1):
+                self._cmd_edit.setPlainText(btn.get("command", ""))
+                if btn.get("command_type", "python") == "mel":
+                    self._cmd_mel.setChecked(True)
+                else:
+                    self._cmd_python.setChecked(True)
 
-        for w in widgets_to_block:
-            w.blockSignals(False)
+            if self._is_tab_built(2):
+                self._shift_cmd_edit.setPlainText(btn.get("shift_command", ""))
+                if btn.get("shift_command_type", "python") == "mel":
+                    self._shift_mel.setChecked(True)
+                else:
+                    self._shift_python.setChecked(True)
 
     def _load_multi_button_colors(self, buttons):
         color_keys = ["bg_color", "icon_tint", "label_bg_color", "label_text_color"]
@@ -1148,7 +1447,7 @@ class ShelfManager(QDialog):
 
         if not selected_btns:
             for widget in color_widgets:
-                widget.setColor(None)
+                widget.reset(None)
             return
 
         # For each color property, check if all selected buttons have the same value
@@ -1156,83 +1455,94 @@ class ShelfManager(QDialog):
             first_val = selected_btns[0].get(key)
             all_same = all(btn.get(key) == first_val for btn in selected_btns)
             if all_same:
-                widget.setColor(first_val)
+                widget.reset(first_val)
             else:
-                widget.setColor(None)
+                widget.reset(None)
+
+    def _text_prop_widgets(self):
+        text_widgets = [self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
+                        self._btn_tooltip_edit]
+        if self._is_tab_built(1):
+            text_widgets.append(self._cmd_edit)
+        if self._is_tab_built(2):
+            text_widgets.append(self._shift_cmd_edit)
+        return text_widgets
 
     def _clear_text_props(self):
-        for w in [self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
-                  self._btn_tooltip_edit, self._cmd_edit, self._shift_cmd_edit]:
-            w.blockSignals(True)
-        self._btn_name_edit.clear()
-        self._btn_icon_edit.clear()
-        self._btn_label_edit.clear()
-        self._btn_tooltip_edit.clear()
-        self._cmd_edit.clear()
-        self._shift_cmd_edit.clear()
-        self._submenu_items = []
-        self._refresh_submenu_list()
-        for w in [self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
-                  self._btn_tooltip_edit, self._cmd_edit, self._shift_cmd_edit]:
-            w.blockSignals(False)
+        text_widgets = self._text_prop_widgets()
+        with _signals_blocked(*text_widgets):
+            for w in text_widgets:
+                w.clear()
+            self._submenu_items = []
+            self._refresh_submenu_list()
 
     def _clear_button_props(self):
-        for w in [self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
-                  self._btn_tooltip_edit, self._cmd_edit, self._shift_cmd_edit]:
-            w.blockSignals(True)
-        self._btn_name_edit.clear()
-        self._btn_icon_edit.clear()
-        self._btn_label_edit.clear()
-        self._btn_tooltip_edit.clear()
-        self._btn_bg_color.setColor(None)
-        self._btn_icon_tint.setColor(None)
-        self._btn_label_bg_color.setColor(None)
-        self._btn_label_text_color.setColor(None)
-        self._cmd_edit.clear()
-        self._shift_cmd_edit.clear()
-        self._submenu_items = []
-        self._refresh_submenu_list()
-        for w in [self._btn_name_edit, self._btn_icon_edit, self._btn_label_edit,
-                  self._btn_tooltip_edit, self._cmd_edit, self._shift_cmd_edit]:
-            w.blockSignals(False)
+        text_widgets = self._text_prop_widgets()
+        with _signals_blocked(*text_widgets):
+            for w in text_widgets:
+                w.clear()
+            self._btn_bg_color.reset(None)
+            self._btn_icon_tint.reset(None)
+            self._btn_label_bg_color.reset(None)
+            self._btn_label_text_color.reset(None)
+            self._submenu_items = []
+            self._refresh_submenu_list()
 
+    @Slot()
     def _on_button_prop_changed(self):
+        # Coalesce keystrokes; _flush_button_props writes the edits out
+        self._prop_timer.start()
+
+    def _flush_pending_props(self):
+        # Must run before the selection, shelf or button order changes,
+        # while the editors still describe the button they were loaded from
+        if self._prop_timer.isActive():
+            self._flush_button_props()
+
+    @Slot()
+    def _flush_button_props(self):
+        self._prop_timer.stop()
         if len(self._current_button_indices) != 1 or not self._current_shelf:
             return
 
         idx = self._current_button_indices[0]
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if shelf_data:
-            buttons = shelf_data.get("buttons", [])
-            if idx < len(buttons) and buttons[idx].get("separator"):
+        old_icon = None
+        buttons = self._current_buttons()
+        if idx < len(buttons):
+            if buttons[idx].get("separator"):
                 return
+            old_icon = buttons[idx].get("icon")
 
-        import copy
         updates = {
             "name": self._btn_name_edit.text(),
             "icon": self._btn_icon_edit.text() or "commandButton.png",
             "label": self._btn_label_edit.text(),
             "annotation": self._btn_tooltip_edit.text(),
-            "command": self._cmd_edit.toPlainText(),
-            "command_type": "mel" if self._cmd_mel.isChecked() else "python",
-            "shift_command": self._shift_cmd_edit.toPlainText(),
-            "shift_command_type": "mel" if self._shift_mel.isChecked() else "python",
-            "submenu": copy.deepcopy(self._submenu_items),
+            "submenu": [dict(item) for item in self._submenu_items],
         }
+        # Tabs that were never opened hold nothing to write back
+        if self._is_tab_built(1):
+            updates["command"] = self._cmd_edit.toPlainText()
+            updates["command_type"] = "mel" if self._cmd_mel.isChecked() else "python"
+        if self._is_tab_built(2):
+            updates["shift_command"] = self._shift_cmd_edit.toPlainText()
+            updates["shift_command_type"] = "mel" if self._shift_mel.isChecked() else "python"
 
         core.update_button(self._current_shelf, idx, updates)
 
+        # While a path is being typed each intermediate value would otherwise
+        # stay cached; the next refresh reloads the old one if still in use
+        if old_icon and old_icon != updates["icon"]:
+            self._icon_cache.pop(old_icon, None)
+
         # Update list item display
         item = self._button_list.item(idx)
         if item:
             display = updates["name"] or updates["label"] or updates["icon"]
             item.setText(display)
-            icon_path = updates["icon"]
-            if not ("/" in icon_path or "\\" in icon_path):
-                item.setIcon(QIcon(":{}".format(icon_path)))
-            else:
-                item.setIcon(QIcon(icon_path))
+            item.setIcon(self._get_icon(updates["icon"]))
 
+    @Slot(list)
     def _on_button_color_changed(self, color_value):
         if not self._current_shelf or not self._current_button_indices:
             return
@@ -1249,16 +1559,10 @@ class ShelfManager(QDialog):
         else:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            return
-
-        buttons = shelf_data.get("buttons", [])
-
-        for idx in self._current_button_indices:
-            if idx < len(buttons) and not buttons[idx].get("separator"):
-                core.update_button(self._current_shelf, idx, {key: color_value})
+        indices = [idx for idx in self._current_button_indices if idx not in self._separator_rows]
+        core.update_buttons(self._current_shelf, indices, {key: color_value})
 
+    @Slot()
     def _browse_icon(self):
         try:
             from . import icon_chooser
@@ -1270,104 +1574,107 @@ class ShelfManager(QDialog):
     def _on_icon_selected(self, icon_name):
         self._btn_icon_edit.setText(icon_name)
 
+    @Slot()
     def _add_button(self):
+        self._flush_pending_props()
         if not self._current_shelf:
             return
         new_btn = core.make_default_button(command="print('new')")
         core.add_button_to_shelf(self._current_shelf, new_btn)
-        self._refresh_button_list()
-        self._button_list.setCurrentRow(self._button_list.count() - 1)
+        row = self._button_list.count()
+        self._add_button_item(row, new_btn)
+        self._button_list.setCurrentRow(row)
 
+    @Slot()
     def _add_separator(self):
+        self._flush_pending_props()
         if not self._current_shelf:
             return
-        core.add_button_to_shelf(self._current_shelf, core.make_separator())
-        self._refresh_button_list()
+        separator = core.make_separator()
+        core.add_button_to_shelf(self._current_shelf, separator)
+        self._add_button_item(self._button_list.count(), separator)
 
+    @Slot()
     def _duplicate_button(self):
+        self._flush_pending_props()
         if not self._current_shelf or not self._current_button_indices:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            return
-
-        buttons = shelf_data.get("buttons", [])
-        import copy
-        for idx in sorted(self._current_button_indices):
-            if idx < len(buttons):
-                core.add_button_to_shelf(self._current_shelf, copy.deepcopy(buttons[idx]))
-
-        self._refresh_button_list()
+        buttons = self._current_buttons()
+        with core.batch_edits():
+            for idx in self._current_button_indices:
+                if idx < len(buttons):
+                    clone = _clone_button(buttons[idx])
+                    core.add_button_to_shelf(self._current_shelf, clone)
+                    self._add_button_item(self._button_list.count(), clone)
 
+    @Slot()
     def _delete_button(self):
+        self._flush_pending_props()
         if not self._current_shelf or not self._current_button_indices:
             return
 
-        for idx in sorted(self._current_button_indices, reverse=True):
-            core.remove_button(self._current_shelf, idx)
+        removed = []
+        with core.batch_edits():
+            for idx in reversed(self._current_button_indices):
+                if core.remove_button(self._current_shelf, idx):
+                    removed.append(idx)
 
-        self._current_button_indices = []
-        self._refresh_button_list()
+        self._remove_button_items(removed)
 
     def _transfer_buttons(self, target_shelf):
+        self._flush_pending_props()
         if not self._current_shelf or not self._current_button_indices:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            return
+        buttons = self._current_buttons()
+        with core.batch_edits():
+            for idx in self._current_button_indices:
+                if idx < len(buttons):
+                    core.add_button_to_shelf(target_shelf, _clone_button(buttons[idx]))
 
-        buttons = shelf_data.get("buttons", [])
-        import copy
-        for idx in sorted(self._current_button_indices):
-            if idx < len(buttons):
-                core.add_button_to_shelf(target_shelf, copy.deepcopy(buttons[idx]))
+            removed = []
+            for idx in reversed(self._current_button_indices):
+                if core.remove_button(self._current_shelf, idx):
+                    removed.append(idx)
 
-        for idx in sorted(self._current_button_indices, reverse=True):
-            core.remove_button(self._current_shelf, idx)
-
-        self._current_button_indices = []
-        self._refresh_button_list()
+        self._remove_button_items(removed)
 
     def _copy_buttons_to(self, target_shelf):
+        self._flush_pending_props()
         if not self._current_shelf or not self._current_button_indices:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            return
-
-        buttons = shelf_data.get("buttons", [])
-        import copy
-        for idx in sorted(self._current_button_indices):
-            if idx < len(buttons):
-                core.add_button_to_shelf(target_shelf, copy.deepcopy(buttons[idx]))
+        buttons = self._current_buttons()
+        with core.batch_edits():
+            for idx in self._current_button_indices:
+                if idx < len(buttons):
+                    core.add_button_to_shelf(target_shelf, _clone_button(buttons[idx]))
 
+    @Slot(QModelIndex, int, int, QModelIndex, int)
     def _on_buttons_reordered(self, parent, start, end, dest, row):
+        # Pending edits were flushed on the mouse press that began the drag;
+        # by now the list rows have moved and no longer match the config
         if not self._current_shelf:
             return
 
-        shelf_data = core.get_shelf_data(self._current_shelf)
-        if not shelf_data:
-            return
-
-        buttons = shelf_data.get("buttons", [])
-        if start < len(buttons):
-            btn = buttons.pop(start)
-            insert_pos = row if row < start else row - 1
-            buttons.insert(insert_pos, btn)
-            core.update_shelf_buttons(self._current_shelf, buttons)
+        # row is the drop position before removal, which is what move_button takes
+        if core.move_button(self._current_shelf, start, row):
+            self._update_separator_rows()
 
     # Submenu operations
     def _refresh_submenu_list(self):
+        if not self._is_tab_built(3):
+            return
+        self._submenu_list.setUpdatesEnabled(False)
         self._submenu_list.clear()
-        for item in self._submenu_items:
-            if item.get("separator"):
-                self._submenu_list.addItem("--- Separator ---")
-            else:
-                self._submenu_list.addItem(item.get("label", "Item"))
+        self._submenu_list.addItems([
+            "--- Separator ---" if item.get("separator") else item.get("label", "Item")
+            for item in self._submenu_items
+        ])
+        self._submenu_list.setUpdatesEnabled(True)
 
+    @Slot(int)
     def _on_submenu_selected(self, row):
         if row < 0 or row >= len(self._submenu_items):
             self._sub_cmd_edit.clear()
@@ -1391,19 +1698,15 @@ class ShelfManager(QDialog):
         self._sub_python.setEnabled(True)
         self._sub_mel.setEnabled(True)
 
-        self._sub_cmd_edit.blockSignals(True)
-        self._sub_label_edit.blockSignals(True)
-
-        self._sub_cmd_edit.setPlainText(item.get("command", ""))
-        self._sub_label_edit.setText(item.get("label", ""))
-        if item.get("type", "python") == "mel":
-            self._sub_mel.setChecked(True)
-        else:
-            self._sub_python.setChecked(True)
-
-        self._sub_cmd_edit.blockSignals(False)
-        self._sub_label_edit.blockSignals(False)
+        with _signals_blocked(self._sub_cmd_edit, self._sub_label_edit):
+            self._sub_cmd_edit.setPlainText(item.get("command", ""))
+            self._sub_label_edit.setText(item.get("label", ""))
+            if item.get("type", "python") == "mel":
+                self._sub_mel.setChecked(True)
+            else:
+                self._sub_python.setChecked(True)
 
+    @Slot()
     def _on_submenu_changed(self):
         row = self._submenu_list.currentRow()
         if row < 0 or row >= len(self._submenu_items):
@@ -1420,12 +1723,14 @@ class ShelfManager(QDialog):
         self._submenu_list.item(row).setText(item["label"] or "Item")
         self._on_button_prop_changed()
 
+    @Slot()
     def _add_submenu_item(self):
         self._submenu_items.append({"label": "New Item", "command": "", "type": "python"})
         self._refresh_submenu_list()
         self._submenu_list.setCurrentRow(len(self._submenu_items) - 1)
         self._on_button_prop_changed()
 
+    @Slot()
     def _remove_submenu_item(self):
         row = self._submenu_list.currentRow()
         if row >= 0 and row < len(self._submenu_items):
@@ -1433,11 +1738,13 @@ class ShelfManager(QDialog):
             self._refresh_submenu_list()
             self._on_button_prop_changed()
 
+    @Slot()
     def _add_submenu_separator(self):
         self._submenu_items.append({"separator": True})
         self._refresh_submenu_list()
         self._on_button_prop_changed()
 
+    @Slot(QModelIndex, int, int, QModelIndex, int)
     def _on_submenu_reordered(self, parent, start, end, dest, row):
         if start < len(self._submenu_items):
             item = self._submenu_items.pop(start)
@@ -1445,41 +1752,56 @@ class ShelfManager(QDialog):
             self._submenu_items.insert(insert_pos, item)
             self._on_button_prop_changed()
 
+    @Slot()
     def _refresh_panels(self):
+        self._flush_pending_props()
         widgets.refresh_all_panels()
 
+    @Slot()
     def _import_native_shelf(self):
+        self._flush_pending_props()
         from . import importer
         imported = importer.import_shelf_files(self)
         if imported:
             self._refresh_shelf_list()
 
+    @Slot()
     def _open_trigger_settings(self):
+        self._flush_pending_props()
         dialog = TriggerSettingsDialog(self)
         dialog.exec_()
 
+    @Slot()
     def _open_help(self):
         import webbrowser
         webbrowser.open("https://github.com/revoconner/Maya-Neo-Shelf/wiki/User-Guide")
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress:
-            if obj == self._shelf_list.viewport():
-                item = self._shelf_list.itemAt(event.pos())
-                if item is None:
-                    self._options_stack.setCurrentIndex(0)
-                    self._update_column_highlight(0)
-            elif obj == self._button_list.viewport():
-                item = self._button_list.itemAt(event.pos())
-                if item is None:
-                    self._button_list.clearSelection()
-                    self._current_button_indices = []
-                    self._clear_button_props()
-                    self._update_button_controls()
-                    self._options_stack.setCurrentIndex(1)
-                    self._update_column_highlight(1)
+        # Every mouse event on both viewports comes through here
+        if event.type() != QEvent.MouseButtonPress:
+            return super(ShelfManager, self).eventFilter(obj, event)
+        if obj is self._shelf_viewport:
+            item = self._shelf_list.itemAt(event.pos())
+            if item is None:
+                self._options_stack.setCurrentIndex(0)
+                self._update_column_highlight(0)
+        elif obj is self._button_viewport:
+            # Flush before a possible drag reorders the rows under the editors
+            self._flush_pending_props()
+            item = self._button_list.itemAt(event.pos())
+            if item is None:
+                self._button_list.clearSelection()
+                self._current_button_indices = []
+                self._clear_button_props()
+                self._update_button_controls()
+                self._options_stack.setCurrentIndex(1)
+                self._update_column_highlight(1)
         return super(ShelfManager, self).eventFilter(obj, event)
 
+    def closeEvent(self, event):
+        self._flush_pending_props()
+        super(ShelfManager, self).closeEvent(event)
+
 
 def show(select_shelf=None):
     global _manager_instance
@@ -1,19 +1,19 @@
 try:
-    from PySide6.QtCore import Qt, QSize, QRect, QPoint, QTimer, Signal, QPointF, QMimeData
+    from PySide6.QtCore import Qt, QSize, QRect, QPoint, QTimer, Signal, QPointF, QMimeData, QEventLoop
     from PySide6.QtWidgets import (
         QWidget, QLayout, QToolButton, QVBoxLayout, QHBoxLayout,
         QScrollArea, QMenu, QSizePolicy, QLabel, QApplication
     )
     from PySide6.QtGui import QIcon, QColor, QPainter, QBrush, QPen, QPixmap, QDragEnterEvent, QDropEvent, QDrag
-    from shiboken6 import wrapInstance
+    from shiboken6 import wrapInstance, delete, isValid
 except ImportError:
-    from PySide2.QtCore import Qt, QSize, QRect, QPoint, QTimer, Signal, QPointF, QMimeData
+    from PySide2.QtCore import Qt, QSize, QRect, QPoint, QTimer, Signal, QPointF, QMimeData, QEventLoop
     from PySide2.QtWidgets import (
         QWidget, QLayout, QToolButton, QVBoxLayout, QHBoxLayout,
         QScrollArea, QMenu, QSizePolicy, QLabel, QApplication
     )
     from PySide2.QtGui import QIcon, QColor, QPainter, QBrush, QPen, QPixmap, QDragEnterEvent, QDropEvent, QDrag
-    from shiboken2 import wrapInstance
+    from shiboken2 import wrapInstance, delete, isValid
 
 import maya.cmds as cmds
 import maya.mel as mel
@@ -21,23 +21,55 @@ from maya import OpenMayaUI as omui
 from maya.app.general.mayaMixin import MayaQWidgetDockableMixin
 
 from . import core
+import collections
+import functools
 import re
 
 PANEL_PREFIX = "neoShelf_"
 REORDER_MIME_TYPE = "application/x-neo-shelf-index"
 _active_panels = {}
 _panel_close_jobs = {}
+_refresh_all_pending = False
+
+# Finished button icons keyed by (path, size, tint, device pixel ratio),
+# least recently used first; shelves tend to repeat the same few icons
+ICON_CACHE_SIZE = 256
+_icon_cache = collections.OrderedDict()
+# Bumped whenever the icon cache is dropped, so reused buttons fetch theirs again
+_icon_generation = 0
+
+# manager imports this module, so it is bound on first use rather than at import
+_manager = None
+
+
+def _get_manager():
+    global _manager
+    if _manager is None:
+        from . import manager
+        _manager = manager
+    return _manager
+
+
+@functools.lru_cache(maxsize=None)
+def _panel_names(shelf_name):
+    """Return the (widget object name, workspaceControl name) for a shelf."""
+    base_name = PANEL_PREFIX + shelf_name.replace(" ", "_")
+    return base_name, base_name + "WorkspaceControl"
 
 
 def _on_panel_closed(workspace_name):
     """Called when a panel is closed via closeCommand callback."""
-    if workspace_name in _active_panels:
-        del _active_panels[workspace_name]
+    panel = _active_panels.pop(workspace_name, None)
+    if panel is not None:
+        try:
+            panel._refresh_timer.stop()
+        except RuntimeError:
+            # The Qt side may already be gone by the time Maya calls back
+            pass
     core.unregister_panel(workspace_name)
     # Notify manager if open
     try:
-        from . import manager
-        manager.notify_panel_closed(workspace_name)
+        _get_manager().notify_panel_closed(workspace_name)
     except Exception:
         pass
 
@@ -46,58 +78,187 @@ def _register_panel_close_callback(workspace_name):
     """Register closeCommand callback and set flags on workspace control."""
     cmd = "from neo_shelf import widgets; widgets._on_panel_closed('{}')".format(workspace_name)
     try:
-        cmds.workspaceControl(workspace_name, edit=True, closeCommand=cmd)
-        cmds.workspaceControl(workspace_name, edit=True, actLikeMayaUIElement=True)
+        cmds.workspaceControl(workspace_name, edit=True, closeCommand=cmd, actLikeMayaUIElement=True)
     except Exception as e:
         print("[neo_shelf] Failed to configure workspace control: {}".format(e))
 
 
+# Python indicators
+_PYTHON_PATTERNS = (
+    r'^import\s+',
+    r'^from\s+\w+\s+import',
+    r'^def\s+\w+\s*\(',
+    r'^class\s+\w+',
+    r'^\s*print\s*\(',
+    r'cmds\.',
+    r'pymel\.',
+    r'maya\.cmds',
+    r'__\w+__',
+    r'\.format\(',
+    r'f".*\{',
+    r"f'.*\{",
+)
+
+# MEL indicators
+_MEL_PATTERNS = (
+    r'^global\s+proc\s+',
+    r'^proc\s+',
+    r'^\s*\$\w+\s*=',
+    r';\s*$',
+    r'`[^`]+`',
+    r'-\w+\s+\d',
+    r'-\w+\s+"',
+    r'-\w+\s+\$',
+)
+
+
+def _compile_any(patterns):
+    # One alternation scans the code once instead of once per pattern
+    return re.compile("|".join("(?:{})".format(p) for p in patterns), re.MULTILINE)
+
+
+_PYTHON_RE = _compile_any(_PYTHON_PATTERNS)
+_MEL_RE = _compile_any(_MEL_PATTERNS)
+
+
 def _detect_script_type(code):
     """Detect if code is MEL or Python based on syntax patterns."""
     code = code.strip()
     if not code:
         return "python"
 
-    # Python indicators
-    python_patterns = [
-        r'^import\s+',
-        r'^from\s+\w+\s+import',
-        r'^def\s+\w+\s*\(',
-        r'^class\s+\w+',
-        r'^\s*print\s*\(',
-        r'cmds\.',
-        r'pymel\.',
-        r'maya\.cmds',
-        r'__\w+__',
-        r'\.format\(',
-        r'f".*\{',
-        r"f'.*\{",
-    ]
-
-    # MEL indicators
-    mel_patterns = [
-        r'^global\s+proc\s+',
-        r'^proc\s+',
-        r'^\s*\$\w+\s*=',
-        r';\s*$',
-        r'`[^`]+`',
-        r'-\w+\s+\d',
-        r'-\w+\s+"',
-        r'-\w+\s+\$',
-    ]
-
-    for pattern in python_patterns:
-        if re.search(pattern, code, re.MULTILINE):
-            return "python"
-
-    for pattern in mel_patterns:
-        if re.search(pattern, code, re.MULTILINE):
-            return "mel"
+    if _PYTHON_RE.search(code):
+        return "python"
+
+    if _MEL_RE.search(code):
+        return "mel"
 
     # Default to python if undetermined
     return "python"
 
 
+def resolve_icon_path(icon_path):
+    """Return the path Qt should load for a button's icon value."""
+    # Bare names are Maya resources; anything with a separator or an
+    # explicit ":" prefix is used as written
+    if icon_path.startswith(":") or "/" in icon_path or "\\" in icon_path:
+        return icon_path
+    return ":" + icon_path
+
+
+def _color_key(color):
+    # Stored colors are lists; the style caches need something hashable
+    return tuple(color) if color else None
+
+
+@functools.lru_cache(maxsize=256)
+def _rgb(color):
+    # 0-1 float color key -> 0-255 ints, worked out once per distinct color
+    return tuple(int(c * 255) for c in color[:3])
+
+
+@functools.lru_cache(maxsize=256)
+def _button_style(bg, label_text):
+    style_parts = ["border: none;", "border-radius: 5px;"]
+    if bg:
+        style_parts.append("background-color: rgb({},{},{});".format(*_rgb(bg)))
+
+    if label_text:
+        style_parts.append("color: rgb({},{},{});".format(*_rgb(label_text)))
+
+    return "QToolButton {{ {} }} QToolTip {{ background-color: #383838; color: white; border: 1px solid #555; }}".format(
+        " ".join(style_parts))
+
+
+@functools.lru_cache(maxsize=256)
+def _label_style(label_bg, text_color):
+    if label_bg:
+        r, g, b = _rgb(label_bg)
+        a = int(label_bg[3] * 255) if len(label_bg) > 3 else 128
+    else:
+        r, g, b, a = 0, 0, 0, 128
+
+    if text_color:
+        tr, tg, tb = _rgb(text_color)
+    else:
+        tr, tg, tb = 255, 255, 255
+
+    return "background-color: rgba({},{},{},{}); color: rgb({},{},{}); font-weight: bold; padding: 3px 0px;".format(
+        r, g, b, a, tr, tg, tb)
+
+
+@functools.lru_cache(maxsize=64)
+def _scroll_style(bg, highlight):
+    if highlight:
+        return "QScrollArea {{ border: 3px solid rgb({},{},{}); background-color: rgb({},{},{}); }}".format(
+            *(_rgb(highlight) + _rgb(bg)))
+    return "QScrollArea {{ border: 1px solid #444; background-color: rgb({},{},{}); }}".format(*_rgb(bg))
+
+
+def _apply_tint(pixmap, tint_color):
+    """Apply a color tint to a pixmap using the original as a mask."""
+    if not tint_color or len(tint_color) < 3:
+        return pixmap
+
+    tint = QColor(*_rgb(_color_key(tint_color)))
+
+    result = QPixmap(pixmap.size())
+    result.setDevicePixelRatio(pixmap.devicePixelRatio())
+    result.fill(Qt.transparent)
+
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+    # Draw original pixmap
+    painter.drawPixmap(0, 0, pixmap)
+
+    # Apply tint using SourceIn composition (uses original alpha as mask)
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(result.rect(), tint)
+
+    painter.end()
+    return result
+
+
+def _build_button_icon(icon_path, icon_size, icon_tint, dpr):
+    full_path = resolve_icon_path(icon_path)
+    phys_size = int(icon_size * dpr)
+
+    # SVG files need QIcon directly, raster images use QPixmap for scaling
+    if icon_path.lower().endswith(".svg"):
+        icon = QIcon(full_path)
+        if icon_tint:
+            pixmap = icon.pixmap(phys_size, phys_size)
+            pixmap.setDevicePixelRatio(dpr)
+            if not pixmap.isNull():
+                return QIcon(_apply_tint(pixmap, icon_tint))
+        return icon
+
+    pixmap = QPixmap(full_path)
+    if pixmap.isNull():
+        return QIcon(full_path)
+    scaled = pixmap.scaled(phys_size, phys_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    scaled.setDevicePixelRatio(dpr)
+    if icon_tint:
+        scaled = _apply_tint(scaled, icon_tint)
+    return QIcon(scaled)
+
+
+def _get_button_icon(icon_path, icon_size, icon_tint, dpr):
+    key = (icon_path, icon_size, tuple(icon_tint) if icon_tint else None, dpr)
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        _icon_cache.move_to_end(key)
+        return icon
+
+    icon = _build_button_icon(icon_path, icon_size, icon_tint, dpr)
+    _icon_cache[key] = icon
+    if len(_icon_cache) > ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return icon
+
+
 def get_maya_main_window():
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QWidget)
@@ -110,9 +271,12 @@ class FlowLayout(QLayout):
         super(FlowLayout, self).__init__(parent)
         self._items = []
         self._spacing = 2
+        # (width, height, is_break) per item, rebuilt after any invalidate()
+        self._hints = None
 
     def addItem(self, item):
         self._items.append(item)
+        self._hints = None
 
     def count(self):
         return len(self._items)
@@ -124,6 +288,7 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._items):
+            self._hints = None
             return self._items.pop(index)
         return None
 
@@ -133,6 +298,24 @@ class FlowLayout(QLayout):
     def setSpacing(self, spacing):
         self._spacing = spacing
 
+    def invalidate(self):
+        # Qt calls this when a child's size hint or visibility changes
+        self._hints = None
+        super(FlowLayout, self).invalidate()
+
+    def _item_hints(self):
+        if self._hints is None:
+            hints = []
+            for item in self._items:
+                widget = item.widget()
+                if widget is not None and getattr(widget, "_break_line", False):
+                    hints.append((0, 0, True))
+                else:
+                    size = item.sizeHint()
+                    hints.append((size.width(), size.height(), False))
+            self._hints = hints
+        return self._hints
+
     def hasHeightForWidth(self):
         return True
 
@@ -156,40 +339,79 @@ class FlowLayout(QLayout):
 
     def _do_layout(self, rect, move=False):
         m = self.contentsMargins()
-        effective_rect = rect.adjusted(m.left(), m.top(), -m.right(), -m.bottom())
-        x = effective_rect.x()
-        y = effective_rect.y()
+        # Plain locals for everything the loop reads; this runs on every resize
+        left = rect.x() + m.left()
+        right = rect.right() - m.right()
+        spacing = self._spacing
+        x = left
+        y = rect.y() + m.top()
         row_height = 0
 
-        for item in self._items:
-            widget = item.widget()
-            if widget and hasattr(widget, "_break_line") and widget._break_line:
+        for item, (w, h, is_break) in zip(self._items, self._item_hints()):
+            if is_break:
                 if row_height > 0:
-                    x = effective_rect.x()
-                    y = y + row_height + self._spacing
+                    x = left
+                    y += row_height + spacing
                     row_height = 0
                 if move:
-                    item.setGeometry(QRect(QPoint(x, y), QSize(0, 0)))
+                    item.setGeometry(QRect(x, y, 0, 0))
                 continue
 
-            item_size = item.sizeHint()
-            next_x = x + item_size.width() + self._spacing
-
-            if next_x - self._spacing > effective_rect.right() and row_height > 0:
-                x = effective_rect.x()
-                y = y + row_height + self._spacing
-                next_x = x + item_size.width() + self._spacing
+            if x + w > right and row_height > 0:
+                x = left
+                y += row_height + spacing
                 row_height = 0
 
             if move:
-                item.setGeometry(QRect(QPoint(x, y), item_size))
+                item.setGeometry(QRect(x, y, w, h))
 
-            x = next_x
-            row_height = max(row_height, item_size.height())
+            x += w + spacing
+            if h > row_height:
+                row_height = h
 
         return y + row_height - rect.y() + m.bottom()
 
 
+class _SharedTimer(object):
+    """Single-shot timer shared by every ShelfButton.
+
+    Only one button is pressed at a time, so one timer per purpose is enough;
+    it calls back whichever button started it last.
+    """
+
+    def __init__(self):
+        self._timer = None
+        self._owner = None
+        self._callback = None
+
+    def start(self, owner, callback, msec):
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timeout)
+        elif self._timer.isActive() and self._owner is not owner:
+            # Another button is still waiting; let it act now rather than drop it
+            self._on_timeout()
+        self._owner = owner
+        self._callback = callback
+        self._timer.start(msec)
+
+    def stop(self, owner):
+        if self._owner is owner:
+            if self._timer is not None:
+                self._timer.stop()
+            self._owner = None
+            self._callback = None
+
+    def _on_timeout(self):
+        owner, callback = self._owner, self._callback
+        self._owner = None
+        self._callback = None
+        # The button may have been deleted by a refresh while it was waiting
+        if callback is not None and isValid(owner):
+            callback()
+
+
 class SubmenuIndicator(QWidget):
     """Small triangle indicator for buttons with submenus."""
 
@@ -219,6 +441,9 @@ class ShelfButton(QToolButton):
     HOLD_THRESHOLD = 300
     DOUBLE_CLICK_DELAY = 200
 
+    _hold_timer = _SharedTimer()
+    _single_click_timer = _SharedTimer()
+
     def __init__(self, button_data, index, icon_size=55, shelf_name="", parent=None):
         super(ShelfButton, self).__init__(parent)
         self._data = button_data
@@ -226,16 +451,9 @@ class ShelfButton(QToolButton):
         self._icon_size = icon_size
         self._shelf_name = shelf_name
 
-        # Hold timer for detecting held clicks
-        self._hold_timer = QTimer(self)
-        self._hold_timer.setSingleShot(True)
-        self._hold_timer.timeout.connect(self._on_hold_timeout)
+        # Held clicks and the single-click delay (for double-click detection)
+        # use the class-level shared timers
         self._was_held = False
-
-        # Single-click delay timer (for double-click detection)
-        self._single_click_timer = QTimer(self)
-        self._single_click_timer.setSingleShot(True)
-        self._single_click_timer.timeout.connect(self._on_single_click_timeout)
         self._pending_action = None
         self._was_double_click = False
         self._shift_held = False
@@ -247,8 +465,26 @@ class ShelfButton(QToolButton):
         self.setAutoRaise(True)
         self.setContextMenuPolicy(Qt.NoContextMenu)  # Handle RMB ourselves
 
+        self._appearance_key = self._get_appearance_key()
         self._update_appearance()
 
+    def _get_appearance_key(self):
+        # Everything _update_appearance reads, copied out of the live config
+        # dict so a later edit to it still compares as a change
+        data = self._data
+        return (
+            self._icon_size,
+            _icon_generation,
+            data.get("icon", "commandButton.png"),
+            _color_key(data.get("icon_tint")),
+            data.get("label", ""),
+            data.get("annotation", ""),
+            _color_key(data.get("bg_color")),
+            _color_key(data.get("label_bg_color")),
+            _color_key(data.get("label_text_color")),
+            bool(data.get("submenu")),
+        )
+
     def _update_appearance(self):
         icon_size = max(self._icon_size, 10)
         label = self._data.get("label", "")
@@ -261,58 +497,17 @@ class ShelfButton(QToolButton):
         self.setIconSize(QSize(icon_size, icon_size))
 
         icon_path = self._data.get("icon", "commandButton.png")
-        if icon_path.startswith(":/") or icon_path.startswith(":"):
-            full_path = icon_path
-        elif "/" in icon_path or "\\" in icon_path:
-            full_path = icon_path
-        else:
-            full_path = ":{}".format(icon_path)
-
-        icon_tint = self._data.get("icon_tint")
         dpr = QApplication.instance().devicePixelRatio()
-        phys_size = int(icon_size * dpr)
-
-        # SVG files need QIcon directly, raster images use QPixmap for scaling
-        if icon_path.lower().endswith(".svg"):
-            icon = QIcon(full_path)
-            if icon_tint:
-                pixmap = icon.pixmap(phys_size, phys_size)
-                pixmap.setDevicePixelRatio(dpr)
-                if not pixmap.isNull():
-                    pixmap = self._apply_tint(pixmap, icon_tint)
-                    self.setIcon(QIcon(pixmap))
-                else:
-                    self.setIcon(icon)
-            else:
-                self.setIcon(icon)
-        else:
-            pixmap = QPixmap(full_path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(phys_size, phys_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                scaled.setDevicePixelRatio(dpr)
-                if icon_tint:
-                    scaled = self._apply_tint(scaled, icon_tint)
-                self.setIcon(QIcon(scaled))
-            else:
-                self.setIcon(QIcon(full_path))
+        self.setIcon(_get_button_icon(icon_path, icon_size, self._data.get("icon_tint"), dpr))
 
         tooltip = self._data.get("annotation", "") or self._data.get("label", "")
         self.setToolTip(tooltip)
 
-        style_parts = ["border: none;", "border-radius: 5px;"]
-        bg = self._data.get("bg_color")
-        if bg:
-            r, g, b = [int(c * 255) for c in bg[:3]]
-            style_parts.append("background-color: rgb({},{},{});".format(r, g, b))
-
-        label_text = self._data.get("label_text_color")
-        if label_text:
-            r, g, b = [int(c * 255) for c in label_text[:3]]
-            style_parts.append("color: rgb({},{},{});".format(r, g, b))
-
-        self.setStyleSheet(
-            "QToolButton {{ {} }} QToolTip {{ background-color: #383838; color: white; border: 1px solid #555; }}".format(
-                " ".join(style_parts)))
+        style = _button_style(_color_key(self._data.get("bg_color")),
+                              _color_key(self._data.get("label_text_color")))
+        # Reassigning a stylesheet repolishes the widget even if it is the same
+        if self.styleSheet() != style:
+            self.setStyleSheet(style)
 
         if label:
             if not self._label_widget:
@@ -322,22 +517,10 @@ class ShelfButton(QToolButton):
 
             self._label_widget.setText(label)
 
-            label_bg = self._data.get("label_bg_color")
-            if label_bg:
-                r, g, b = [int(c * 255) for c in label_bg[:3]]
-                a = int(label_bg[3] * 255) if len(label_bg) > 3 else 128
-            else:
-                r, g, b, a = 0, 0, 0, 128
-
-            text_color = self._data.get("label_text_color")
-            if text_color:
-                tr, tg, tb = [int(c * 255) for c in text_color[:3]]
-            else:
-                tr, tg, tb = 255, 255, 255
-
-            self._label_widget.setStyleSheet(
-                "background-color: rgba({},{},{},{}); color: rgb({},{},{}); font-weight: bold; padding: 3px 0px;".format(r, g, b, a, tr, tg, tb)
-            )
+            label_style = _label_style(_color_key(self._data.get("label_bg_color")),
+                                       _color_key(self._data.get("label_text_color")))
+            if self._label_widget.styleSheet() != label_style:
+                self._label_widget.setStyleSheet(label_style)
 
             label_height = 25
             self._label_widget.setGeometry(0, btn_height - label_height, btn_width, label_height)
@@ -358,12 +541,8 @@ class ShelfButton(QToolButton):
             if self._submenu_indicator:
                 self._submenu_indicator.hide()
 
-    def _get_triggers(self):
-        return core.get_trigger_settings()
-
     def _uses_double_click(self):
-        triggers = self._get_triggers()
-        return "lmb_double_click" in triggers.values()
+        return "lmb_double_click" in core.get_trigger_actions()
 
     def _trigger_action(self, action_name):
         if action_name == "main_command":
@@ -376,11 +555,8 @@ class ShelfButton(QToolButton):
             self._show_submenu()
 
     def _get_action_for_trigger(self, trigger_type):
-        triggers = self._get_triggers()
-        for action, trigger in triggers.items():
-            if trigger == trigger_type:
-                return action
-        return None
+        # Cached reverse map in core, rebuilt only when the settings change
+        return core.get_trigger_actions().get(trigger_type)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -391,10 +567,14 @@ class ShelfButton(QToolButton):
             # Start hold timer for lmb_hold trigger
             action = self._get_action_for_trigger("lmb_hold")
             if action:
-                self._hold_timer.start(self.HOLD_THRESHOLD)
+                self._hold_timer.start(self, self._on_hold_timeout, self.HOLD_THRESHOLD)
 
         elif event.button() == Qt.MiddleButton:
-            self._drag_start_pos = event.pos()
+            pos = event.pos()
+            # Plain ints so each move event is simple arithmetic; the
+            # platform drag distance is read once per press
+            self._drag_start_pos = (pos.x(), pos.y())
+            self._drag_threshold = QApplication.startDragDistance()
 
         elif event.button() == Qt.RightButton:
             action = self._get_action_for_trigger("rmb_click")
@@ -405,7 +585,9 @@ class ShelfButton(QToolButton):
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.MiddleButton and self._drag_start_pos:
-            if (event.pos() - self._drag_start_pos).manhattanLength() > 10:
+            pos = event.pos()
+            start_x, start_y = self._drag_start_pos
+            if abs(pos.x() - start_x) + abs(pos.y() - start_y) > self._drag_threshold:
                 self._start_drag()
         super(ShelfButton, self).mouseMoveEvent(event)
 
@@ -414,13 +596,21 @@ class ShelfButton(QToolButton):
         mime = QMimeData()
         mime.setData(REORDER_MIME_TYPE, str(self._index).encode())
         drag.setMimeData(mime)
-        drag.setPixmap(self.grab())
-        drag.setHotSpot(QPoint(self.width() // 2, self.height() // 2))
+        # The icon is already rendered and cached, so it makes a cheap preview;
+        # grab() would paint the whole button offscreen first
+        icon_size = self.iconSize()
+        pixmap = self.icon().pixmap(icon_size)
+        if pixmap.isNull():
+            drag.setPixmap(self.grab())
+            drag.setHotSpot(QPoint(self.width() // 2, self.height() // 2))
+        else:
+            drag.setPixmap(pixmap)
+            drag.setHotSpot(QPoint(icon_size.width() // 2, icon_size.height() // 2))
         drag.exec_(Qt.MoveAction)
         self._drag_start_pos = None
 
     def mouseReleaseEvent(self, event):
-        self._hold_timer.stop()
+        self._hold_timer.stop(self)
 
         if event.button() == Qt.LeftButton and not self._was_held and not self._was_double_click:
             # Determine which trigger type this is
@@ -434,7 +624,7 @@ class ShelfButton(QToolButton):
                 # If double-click is configured, delay single-click action
                 if self._uses_double_click():
                     self._pending_action = action
-                    self._single_click_timer.start(self.DOUBLE_CLICK_DELAY)
+                    self._single_click_timer.start(self, self._on_single_click_timeout, self.DOUBLE_CLICK_DELAY)
                 else:
                     self._trigger_action(action)
 
@@ -443,7 +633,7 @@ class ShelfButton(QToolButton):
     def mouseDoubleClickEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._was_double_click = True
-            self._single_click_timer.stop()
+            self._single_click_timer.stop(self)
             self._pending_action = None
 
             action = self._get_action_for_trigger("lmb_double_click")
@@ -498,51 +688,38 @@ class ShelfButton(QToolButton):
             else:
                 label = item.get("label", "Item")
                 action = menu.addAction(label)
-                cmd = item.get("command", "")
-                cmd_type = item.get("type", "python")
-                action.triggered.connect(lambda *args, c=cmd, t=cmd_type: self._execute(c, t))
+                action.setData((item.get("command", ""), item.get("type", "python")))
+        # One connection for the whole menu instead of a closure per item
+        menu.triggered.connect(self._on_submenu_triggered)
 
         menu.exec_(self.mapToGlobal(QPoint(0, self.height())))
 
+    def _on_submenu_triggered(self, action):
+        cmd, cmd_type = action.data()
+        self._execute(cmd, cmd_type)
+
     def _open_manager(self):
         try:
-            from . import manager
-            manager.show_with_button(self._shelf_name, self._index)
+            _get_manager().show_with_button(self._shelf_name, self._index)
         except Exception as e:
             cmds.warning("[neo_shelf] Manager error: {}".format(e))
 
-    def _apply_tint(self, pixmap, tint_color):
-        """Apply a color tint to a pixmap using the original as a mask."""
-        if not tint_color or len(tint_color) < 3:
-            return pixmap
-
-        r, g, b = [int(c * 255) for c in tint_color[:3]]
-        tint = QColor(r, g, b)
-
-        result = QPixmap(pixmap.size())
-        result.setDevicePixelRatio(pixmap.devicePixelRatio())
-        result.fill(Qt.transparent)
-
-        painter = QPainter(result)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-        # Draw original pixmap
-        painter.drawPixmap(0, 0, pixmap)
-
-        # Apply tint using SourceIn composition (uses original alpha as mask)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(result.rect(), tint)
-
-        painter.end()
-        return result
+    def update_index(self, index, shelf_name=""):
+        self._index = index
+        if shelf_name:
+            self._shelf_name = shelf_name
 
-    def update_data(self, data, index, shelf_name=""):
+    def update_data(self, data, index, shelf_name="", icon_size=None):
         self._data = data
         self._index = index
         if shelf_name:
             self._shelf_name = shelf_name
-        self._update_appearance()
+        if icon_size is not None:
+            self._icon_size = icon_size
+        key = self._get_appearance_key()
+        if key != self._appearance_key:
+            self._appearance_key = key
+            self._update_appearance()
 
 
 class ShelfSeparator(QWidget):
@@ -587,8 +764,7 @@ class ShelfSeparator(QWidget):
 
     def _show_context_menu(self, pos):
         try:
-            from . import manager
-            manager.show_with_button(self._shelf_name, self._index)
+            _get_manager().show_with_button(self._shelf_name, self._index)
         except Exception as e:
             cmds.warning("[neo_shelf] Manager error: {}".format(e))
 
@@ -599,12 +775,16 @@ class ShelfSeparator(QWidget):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton:
-            self._drag_start_pos = event.pos()
+            pos = event.pos()
+            self._drag_start_pos = (pos.x(), pos.y())
+            self._drag_threshold = QApplication.startDragDistance()
         super(ShelfSeparator, self).mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.MiddleButton and self._drag_start_pos:
-            if (event.pos() - self._drag_start_pos).manhattanLength() > 10:
+            pos = event.pos()
+            start_x, start_y = self._drag_start_pos
+            if abs(pos.x() - start_x) + abs(pos.y() - start_y) > self._drag_threshold:
                 self._start_drag()
         super(ShelfSeparator, self).mouseMoveEvent(event)
 
@@ -635,8 +815,7 @@ class FlowBreakWidget(QWidget):
 
     def _show_context_menu(self, pos):
         try:
-            from . import manager
-            manager.show_with_button(self._shelf_name, self._index)
+            _get_manager().show_with_button(self._shelf_name, self._index)
         except Exception as e:
             cmds.warning("[neo_shelf] Manager error: {}".format(e))
 
@@ -647,12 +826,16 @@ class FlowBreakWidget(QWidget):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MiddleButton:
-            self._drag_start_pos = event.pos()
+            pos = event.pos()
+            self._drag_start_pos = (pos.x(), pos.y())
+            self._drag_threshold = QApplication.startDragDistance()
         super(FlowBreakWidget, self).mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if event.buttons() & Qt.MiddleButton and self._drag_start_pos:
-            if (event.pos() - self._drag_start_pos).manhattanLength() > 10:
+            pos = event.pos()
+            start_x, start_y = self._drag_start_pos
+            if abs(pos.x() - start_x) + abs(pos.y() - start_y) > self._drag_threshold:
                 self._start_drag()
         super(FlowBreakWidget, self).mouseMoveEvent(event)
 
@@ -686,8 +869,14 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
         super(ShelfPanel, self).__init__(parent=parent)
         self._shelf_name = shelf_name
         self._buttons = []
-        base_name = PANEL_PREFIX + shelf_name.replace(" ", "_")
-        self._workspace_name = base_name + "WorkspaceControl"
+        # (layout mode, alignment) the current button layout was built for
+        self._layout_key = None
+        # Highlight state last applied, so a click only restyles panels it changes
+        self._is_active = None
+        self._applied_scroll_style = None
+        # Set while hidden; the highlight is applied when the panel is shown
+        self._highlight_pending = False
+        base_name, self._workspace_name = _panel_names(shelf_name)
 
         self.setObjectName(base_name)
         self.setWindowTitle("Shelf: {}".format(shelf_name))
@@ -696,8 +885,14 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_shelf_menu)
 
+        # refresh() only arms this; a burst of edits rebuilds once
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self._build_ui()
-        self.refresh()
+        self._do_refresh()
 
         core.register_panel(self._workspace_name, shelf_name)
         _active_panels[self._workspace_name] = self
@@ -732,7 +927,9 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
 
         old_layout = self._content.layout()
         if old_layout:
-            QWidget().setLayout(old_layout)
+            # Its items are already taken; deleting the layout detaches it
+            # from _content at once, without a throwaway widget to adopt it
+            delete(old_layout)
 
         # Map alignment string to Qt alignment
         h_align_map = {
@@ -760,55 +957,104 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
         self._button_layout.setSpacing(10)
 
     def refresh(self):
-        self._buttons.clear()
+        """Schedule a rebuild of the panel on the next event loop pass."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_refresh(self):
+        self._refresh_timer.stop()
+        # Hold off painting while the old children go and the new ones are
+        # added, so the content is laid out and painted once at the end
+        self._content.setUpdatesEnabled(False)
+        try:
+            self._rebuild()
+        finally:
+            self._content.setUpdatesEnabled(True)
+
+        # Docked panels need an explicit repaint request (Maya workspaceControl
+        # bug workaround); update() covers the children and is coalesced with
+        # the paint the event loop already owes, where repaint() forced a
+        # synchronous extra pass. Refreshes now run from the event loop too,
+        # after Maya has finished its docking work.
+        self.update()
 
+    def _rebuild(self):
         shelf_data = core.get_shelf_data(self._shelf_name)
         if not shelf_data:
+            self._buttons = []
+            self._layout_key = None
             self._setup_layout("flow")
             return
 
         layout_mode = shelf_data.get("layout", "flow")
         alignment = shelf_data.get("alignment", "left")
-        self._setup_layout(layout_mode, alignment)
+        old_widgets = self._buttons
+        # The layout is only torn down when its mode or alignment changes;
+        # otherwise the existing widgets are reused below
+        if (layout_mode, alignment) != self._layout_key:
+            self._setup_layout(layout_mode, alignment)
+            self._layout_key = (layout_mode, alignment)
+            old_widgets = []
 
         icon_size = shelf_data.get("icon_size", 55)
 
         bg = shelf_data.get("bg_color")
         if bg:
-            r, g, b = [int(c * 255) for c in bg[:3]]
-            self._content.setStyleSheet("background-color: rgb({},{},{});".format(r, g, b))
+            content_style = "background-color: rgb({},{},{});".format(*_rgb(_color_key(bg)))
         else:
-            self._content.setStyleSheet("")
+            content_style = ""
+        if self._content.styleSheet() != content_style:
+            self._content.setStyleSheet(content_style)
 
+        # Walk the buttons by index; a widget of the right kind already in
+        # that slot is updated in place, anything else is created fresh
+        new_widgets = []
         buttons = shelf_data.get("buttons", [])
         for i, btn_data in enumerate(buttons):
+            old = old_widgets[i] if i < len(old_widgets) else None
             if btn_data.get("separator"):
-                if layout_mode == "horizontal":
-                    sep = ShelfSeparator(i, "vertical", self._shelf_name, self._content)
+                if isinstance(old, (ShelfSeparator, FlowBreakWidget)):
+                    old.update_index(i, self._shelf_name)
+                    widget = old
+                elif layout_mode == "horizontal":
+                    widget = ShelfSeparator(i, "vertical", self._shelf_name, self._content)
                 elif layout_mode == "vertical":
-                    sep = ShelfSeparator(i, "horizontal", self._shelf_name, self._content)
+                    widget = ShelfSeparator(i, "horizontal", self._shelf_name, self._content)
                 else:
-                    sep = FlowBreakWidget(i, self._shelf_name, self._content)
-                self._button_layout.addWidget(sep)
-                self._buttons.append(sep)
+                    widget = FlowBreakWidget(i, self._shelf_name, self._content)
+            elif isinstance(old, ShelfButton):
+                old.update_data(btn_data, i, self._shelf_name, icon_size)
+                widget = old
             else:
-                btn = ShelfButton(btn_data, i, icon_size, self._shelf_name, self._content)
-                self._button_layout.addWidget(btn)
-                self._buttons.append(btn)
+                widget = ShelfButton(btn_data, i, icon_size, self._shelf_name, self._content)
+            new_widgets.append(widget)
+
+        self._buttons = new_widgets
+        if len(new_widgets) != len(old_widgets) or any(a is not b for a, b in zip(new_widgets, old_widgets)):
+            self._reseat_widgets(old_widgets, new_widgets)
 
         self._content.updateGeometry()
-        self._apply_highlight(self._shelf_name == core.get_active_shelf())
+        self._apply_highlight(self._shelf_name == core.get_active_shelf(), shelf_data)
 
-        # Force repaint for docked panels (Maya workspaceControl bug workaround)
-        self._content.update()
-        self._scroll.update()
-        self.update()
-        self.repaint()
+    def _reseat_widgets(self, old_widgets, new_widgets):
+        # Empty the layout without reparenting, drop the widgets that were
+        # not reused, then add the new order back in one pass
+        layout = self._button_layout
+        while layout.count():
+            layout.takeAt(0)
+
+        kept = set(id(w) for w in new_widgets)
+        for widget in old_widgets:
+            if id(widget) not in kept:
+                widget.setParent(None)
+
+        add_widget = layout.addWidget
+        for widget in new_widgets:
+            add_widget(widget)
 
     def _on_edit_button(self, index):
         try:
-            from . import manager
-            manager.show_with_button(self._shelf_name, index)
+            _get_manager().show_with_button(self._shelf_name, index)
         except Exception as e:
             cmds.warning("[neo_shelf] Manager error: {}".format(e))
 
@@ -826,8 +1072,28 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
             self.refresh()
 
     def _on_move_button(self, from_idx, to_idx):
-        core.move_button(self._shelf_name, from_idx, to_idx)
-        self.refresh()
+        if core.move_button(self._shelf_name, from_idx, to_idx):
+            self._reorder_in_place(from_idx, to_idx)
+
+    def _reorder_in_place(self, from_idx, to_idx):
+        """Mirror core.move_button on the existing widgets instead of rebuilding."""
+        widgets = list(self._buttons)
+        if not 0 <= from_idx < len(widgets) or not 0 <= to_idx <= len(widgets):
+            self.refresh()
+            return
+
+        widget = widgets.pop(from_idx)
+        if to_idx > from_idx:
+            to_idx -= 1
+        widgets.insert(to_idx, widget)
+
+        # Only the slots between the two positions changed index
+        for i in range(min(from_idx, to_idx), max(from_idx, to_idx) + 1):
+            widgets[i].update_index(i)
+
+        old_widgets = self._buttons
+        self._buttons = widgets
+        self._reseat_widgets(old_widgets, widgets)
 
     def _show_shelf_menu(self, pos):
         menu = QMenu(self)
@@ -866,15 +1132,13 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
 
     def _open_shelf_settings(self):
         try:
-            from . import manager
-            manager.show(select_shelf=self._shelf_name)
+            _get_manager().show(select_shelf=self._shelf_name)
         except Exception as e:
             cmds.warning("[neo_shelf] Manager error: {}".format(e))
 
     def _open_manager(self):
         try:
-            from . import manager
-            manager.show()
+            _get_manager().show()
         except ImportError:
             cmds.warning("[neo_shelf] Manager not yet implemented")
 
@@ -884,25 +1148,37 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
         super(ShelfPanel, self).mousePressEvent(event)
 
     def _update_active_highlight(self):
+        # At most the old and the new active panel change state
+        active_shelf = core.get_active_shelf()
         for ws, panel in _active_panels.items():
-            panel._apply_highlight(panel._shelf_name == core.get_active_shelf())
-
-    def _apply_highlight(self, is_active):
-        shelf_data = core.get_shelf_data(self._shelf_name) or {}
+            is_active = panel._shelf_name == active_shelf
+            if panel._is_active != is_active:
+                panel._apply_highlight(is_active)
+
+    def _apply_highlight(self, is_active, shelf_data=None):
+        self._is_active = is_active
+        if not self.isVisible():
+            self._highlight_pending = True
+            return
+        self._highlight_pending = False
+        if shelf_data is None:
+            shelf_data = core.get_shelf_data(self._shelf_name) or {}
         bg = shelf_data.get("bg_color", [0.22, 0.22, 0.22])
-        bg_r, bg_g, bg_b = [int(c * 255) for c in bg[:3]]
         hide_highlight = shelf_data.get("hide_highlight", False)
 
+        highlight = None
         if is_active and not hide_highlight:
             highlight = shelf_data.get("active_highlight_color", [0.3, 0.5, 0.7])
-            h_r, h_g, h_b = [int(c * 255) for c in highlight[:3]]
-            self._scroll.setStyleSheet(
-                "QScrollArea {{ border: 3px solid rgb({},{},{}); background-color: rgb({},{},{}); }}".format(
-                    h_r, h_g, h_b, bg_r, bg_g, bg_b))
-        else:
-            self._scroll.setStyleSheet(
-                "QScrollArea {{ border: 1px solid #444; background-color: rgb({},{},{}); }}".format(
-                    bg_r, bg_g, bg_b))
+        style = _scroll_style(_color_key(bg), _color_key(highlight))
+        # Compared on the Python side; styleSheet() would copy the string out of Qt
+        if style != self._applied_scroll_style:
+            self._scroll.setStyleSheet(style)
+            self._applied_scroll_style = style
+
+    def showEvent(self, event):
+        if self._highlight_pending:
+            self._apply_highlight(self._shelf_name == core.get_active_shelf())
+        super(ShelfPanel, self).showEvent(event)
 
     def dragEnterEvent(self, event):
         mime = event.mimeData()
@@ -912,11 +1188,9 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
             event.ignore()
 
     def dragMoveEvent(self, event):
-        mime = event.mimeData()
-        if mime.hasFormat(REORDER_MIME_TYPE) or mime.hasText():
-            event.acceptProposedAction()
-        else:
-            event.ignore()
+        # The mime data cannot change mid-drag and Qt only sends moves after an
+        # accepted dragEnterEvent, so there is nothing to check again here
+        event.acceptProposedAction()
 
     def dropEvent(self, event):
         mime = event.mimeData()
@@ -926,13 +1200,13 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
             if target_idx != source_idx and target_idx != source_idx + 1:
                 if target_idx > source_idx:
                     target_idx -= 1
-                core.move_button(self._shelf_name, source_idx, target_idx)
-                self.refresh()
+                self._on_move_button(source_idx, target_idx)
             event.acceptProposedAction()
         elif mime.hasText():
             code = mime.text().strip()
             if code:
-                self._add_button_from_drop(code)
+                # Multi-line text is one script, so a text drop is one button
+                self._add_buttons_from_drop([code])
                 event.acceptProposedAction()
             else:
                 event.ignore()
@@ -947,24 +1221,37 @@ class ShelfPanel(MayaQWidgetDockableMixin, QWidget):
                 return i
         return len(self._buttons)
 
-    def _add_button_from_drop(self, code):
-        script_type = _detect_script_type(code)
-        new_btn = core.make_default_button(command=code, command_type=script_type)
-        core.add_button_to_shelf(self._shelf_name, new_btn)
+    def _add_buttons_from_drop(self, codes):
+        new_buttons = [
+            core.make_default_button(command=code, command_type=_detect_script_type(code))
+            for code in codes
+        ]
+        # One config write, one refresh and one message however many were dropped
+        core.add_buttons_to_shelf(self._shelf_name, new_buttons)
         self.refresh()
-        cmds.inViewMessage(
-            amg="Button added to shelf <hl>{}</hl>".format(self._shelf_name),
-            pos="botCenter", fade=True, fadeStayTime=1000
-        )
+        if len(new_buttons) == 1:
+            msg = "Button added to shelf <hl>{}</hl>".format(self._shelf_name)
+        else:
+            msg = "{} buttons added to shelf <hl>{}</hl>".format(len(new_buttons), self._shelf_name)
+        cmds.inViewMessage(amg=msg, pos="botCenter", fade=True, fadeStayTime=1000)
+
+
+def _find_shelf_panel(parent_widget):
+    # restore_panel adds the panel straight into the control, so its direct
+    # children are checked before walking the whole subtree
+    for child in parent_widget.children():
+        if isinstance(child, ShelfPanel):
+            return child
+    panels = parent_widget.findChildren(ShelfPanel)
+    return panels[0] if panels else None
 
 
 def restore_panel(shelf_name):
     """Restore a panel from workspace layout (called by uiScript on Maya restart)."""
-    if shelf_name not in core.get_all_shelf_names():
+    if not core.shelf_exists(shelf_name):
         return None
 
-    base_name = PANEL_PREFIX + shelf_name.replace(" ", "_")
-    workspace_name = base_name + "WorkspaceControl"
+    base_name, workspace_name = _panel_names(shelf_name)
 
     if workspace_name in _active_panels:
         return workspace_name
@@ -998,14 +1285,28 @@ def restore_panel(shelf_name):
     return workspace_name
 
 
+def _rebind_panel(shelf_name, workspace_name):
+    """Attach a ShelfPanel to an existing, untracked workspaceControl."""
+    ptr = omui.MQtUtil.findControl(workspace_name)
+    if not ptr:
+        return False
+    panel = _find_shelf_panel(wrapInstance(int(ptr), QWidget))
+    if panel is None:
+        restore_panel(shelf_name)
+    else:
+        _active_panels[workspace_name] = panel
+        core.register_panel(workspace_name, shelf_name)
+        _register_panel_close_callback(workspace_name)
+        panel.refresh()
+    return workspace_name in _active_panels
+
+
 def create_panel(shelf_name):
     """Create a new dockable shelf panel."""
-    if shelf_name not in core.get_all_shelf_names():
+    if not core.shelf_exists(shelf_name):
         core.create_shelf(shelf_name)
 
-    base_name = PANEL_PREFIX + shelf_name.replace(" ", "_")
-    workspace_name = base_name + "WorkspaceControl"
-    ui_script = "from neo_shelf import widgets; widgets.restore_panel('{}')".format(shelf_name)
+    base_name, workspace_name = _panel_names(shelf_name)
 
     # Check if workspaceControl exists
     if cmds.workspaceControl(workspace_name, exists=True):
@@ -1019,12 +1320,23 @@ def create_panel(shelf_name):
                 pass
 
         # WorkspaceControl exists but no panel (stale from previous session)
-        # Delete it so we can create fresh with proper uiScript
+        # Rebuild the panel inside it, which is far cheaper than a new control
+        try:
+            if _rebind_panel(shelf_name, workspace_name):
+                cmds.workspaceControl(workspace_name, edit=True, restore=True)
+                cmds.workspaceControl(workspace_name, edit=True, visible=True)
+                core.set_active_shelf(shelf_name)
+                return workspace_name
+        except RuntimeError:
+            pass
+
+        # Rebinding failed - delete it so we can create fresh with proper uiScript
         cmds.deleteUI(workspace_name)
 
     if cmds.workspaceControlState(workspace_name, exists=True):
         cmds.workspaceControlState(workspace_name, remove=True)
 
+    ui_script = "from neo_shelf import widgets; widgets.restore_panel('{}')".format(shelf_name)
     panel = ShelfPanel(shelf_name)
     panel.show(
         dockable=True,
@@ -1058,7 +1370,23 @@ def close_panel(workspace_name):
 
 
 def refresh_all_panels():
-    """Refresh all open shelf panels."""
+    """Refresh all open shelf panels on the next event loop pass.
+
+    Several calls in a row, as a burst of manager edits makes, share one pass.
+    """
+    global _refresh_all_pending
+    if _refresh_all_pending:
+        return
+    if QApplication.instance() is None:
+        _do_refresh_all_panels()
+        return
+    _refresh_all_pending = True
+    QTimer.singleShot(0, _do_refresh_all_panels)
+
+
+def _do_refresh_all_panels():
+    global _icon_generation, _refresh_all_pending
+    _refresh_all_pending = False
     # First, recover any panels that exist in config but not in _active_panels
     config = core.load_config()
     orphans = []
@@ -1069,36 +1397,43 @@ def refresh_all_panels():
             if ptr:
                 parent_widget = wrapInstance(int(ptr), QWidget)
                 # Look for ShelfPanel child widget
-                found = False
-                for child in parent_widget.findChildren(QWidget):
-                    if isinstance(child, ShelfPanel):
-                        _active_panels[workspace_name] = child
-                        found = True
-                        break
-                if not found:
+                panel = _find_shelf_panel(parent_widget)
+                if panel is not None:
+                    _active_panels[workspace_name] = panel
+                else:
                     # No ShelfPanel found - mark as orphan to clean up
-                    orphans.append(workspace_name)
+                    orphans.append((workspace_name, True))
             else:
                 # WorkspaceControl doesn't exist - mark for cleanup
-                orphans.append(workspace_name)
+                orphans.append((workspace_name, False))
 
-    # Clean up orphaned panel entries from config and delete stale workspaceControls
-    for ws in orphans:
-        if cmds.workspaceControl(ws, exists=True):
+    # Clean up orphaned panel entries from config and delete stale workspaceControls;
+    # findControl above already told us which controls exist
+    for ws, has_control in orphans:
+        if has_control:
             try:
                 cmds.deleteUI(ws)
             except Exception:
                 pass
         core.unregister_panel(ws)
 
+    # An explicit refresh picks up icon files edited on disk
+    _icon_cache.clear()
+    _icon_generation += 1
+
     # Now refresh all tracked panels
-    for ws, panel in list(_active_panels.items()):
+    refreshed = False
+    # Walk a snapshot so a refresh that registers or drops a panel is safe
+    for panel in tuple(_active_panels.values()):
         try:
             panel.refresh()
+            refreshed = True
         except Exception:
             pass
-    # Force Qt to process events (fixes docked panel refresh bug)
-    QApplication.processEvents()
+    # Force Qt to process events (fixes docked panel refresh bug); user input
+    # is left queued so no click or key press runs in the middle of a refresh
+    if refreshed:
+        QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
 
 
 def show(shelf_name=None):
@@ -1107,7 +1442,6 @@ def show(shelf_name=None):
         create_panel(shelf_name)
     else:
         try:
-            from . import manager
-            manager.show()
+            _get_manager().show()
         except ImportError:
             cmds.warning("[neo_shelf] Manager not yet implemented")